@@ -1,24 +1,258 @@
 """
 문서 관리 관련 API 엔드포인트
 """
+import asyncio
+import csv
 import logging
 import os
-import json
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, UploadFile, File, Query
-from fastapi.responses import FileResponse
+import shutil
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+import aiofiles
+import orjson
 
 from ..models.schemas import (
-    DocumentList, DocumentInfo, SectionsList, SectionDetail, 
-    UploadResponse, BaseResponse
+    DocumentList, DocumentInfo, SectionsList, SectionDetail, SectionInfo,
+    UploadResponse, BaseResponse, utc_now
 )
-from ..clients.mcp_client import pdf_get_info
+from ..clients.mcp_client import pdf_get_info, invalidate_mcp_cache
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/docs", tags=["문서관리"])
 
+# 업로드 허용 확장자
+ALLOWED_UPLOAD_EXTENSIONS = frozenset({"pdf"})
+
+# 업로드 스트리밍 청크 크기 (1MB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# 섹션 목록 스트리밍 시 한 번에 내보낼 행 수
+SECTIONS_STREAM_BATCH = 256
+
+# 다운로드 파일 캐시 정책
+DOWNLOAD_CACHE_CONTROL = "public, max-age=60"
+
+
+def invalidate_doc_info(doc_id: str) -> None:
+    """문서 정보 캐시 무효화 (pdf.get_info는 MCP 응답 캐시에만 캐시됨)"""
+    invalidate_mcp_cache(doc_id)
+
+
+def output_path(relative: str) -> str:
+    """
+    출력 디렉토리 기준 경로 생성
+    
+    os.path.join 대신 f-string으로 조합합니다. settings.reload() 후에도
+    새 OUTPUT_DIR을 따르도록 호출 시점의 설정 값을 사용합니다.
+    """
+    return f"{settings.OUTPUT_DIR}/{relative}"
+
+
+def parsed_csv_path(doc_id: str) -> str:
+    """문서의 파싱 결과 CSV 경로"""
+    return f"{settings.OUTPUT_DIR}/{doc_id}_parsed.csv"
+
+
+def scan_output_dir(output_dir: str) -> Tuple[List[str], Set[str]]:
+    """
+    출력 디렉토리 스캔
+    
+    os.scandir 1회 호출로 문서 디렉토리 목록과 파싱 결과 CSV 파일명 집합을 함께 수집합니다.
+    
+    Args:
+        output_dir: 출력 디렉토리 경로
+        
+    Returns:
+        (문서 ID 목록, *_parsed.csv 파일명 집합)
+    """
+    doc_dirs = []
+    csv_names = set()
+    
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                doc_dirs.append(entry.name)
+            elif entry.name.endswith("_parsed.csv") and entry.is_file():
+                csv_names.add(entry.name)
+    
+    return doc_dirs, csv_names
+
+
+def _csv_bool(value: str) -> bool:
+    """CSV 불리언 문자열 변환"""
+    return value.lower() == "true"
+
+
+# 섹션 CSV 컬럼별 변환 규칙: (컬럼명, 변환 함수, 컬럼 누락 시 기본값)
+_SECTION_CSV_COLUMNS = (
+    ("section_id", int, 0),
+    ("level_1", None, ""),
+    ("level_2", None, ""),
+    ("level_3", None, ""),
+    ("kwan", None, ""),
+    ("jo", None, ""),
+    ("page_start", int, 0),
+    ("page_end", int, 0),
+    ("title", None, ""),
+    ("para_count", int, 0),
+    ("char_count", int, 0),
+    ("has_table", _csv_bool, False),
+    ("has_figure", _csv_bool, False),
+    ("extract_path", None, None),
+    ("json_path", None, None),
+)
+
+# SectionInfo 필수 필드에 해당하는 CSV 컬럼 (헤더에 없으면 스트리밍 시작 전에 실패 처리)
+_SECTION_CSV_REQUIRED = frozenset({"section_id", "page_start", "page_end", "title"})
+
+
+def read_sections_csv_header(csv_file: str) -> List[str]:
+    """섹션 CSV 헤더 행 읽기 (빈 파일이면 빈 목록)"""
+    with open(csv_file, "r", newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def iter_sections_csv(f: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    파싱 결과 CSV에서 섹션 정보를 한 행씩 읽기
+    
+    헤더로 컬럼 위치를 한 번만 계산한 뒤 csv.reader로 행을 읽어
+    행마다 dict를 만드는 DictReader 비용을 피합니다.
+    
+    Args:
+        f: newline=""로 연 *_parsed.csv 파일 객체
+        
+    Yields:
+        섹션 정보 dict
+    """
+    reader = csv.reader(f)
+    header = next(reader, [])
+    index = {name: i for i, name in enumerate(header)}
+    columns = [
+        (name, index.get(name), convert, default)
+        for name, convert, default in _SECTION_CSV_COLUMNS
+    ]
+    
+    for row in reader:
+        section = {}
+        for name, i, convert, default in columns:
+            if i is None or i >= len(row):
+                section[name] = default
+            elif convert is None:
+                section[name] = row[i]
+            else:
+                section[name] = convert(row[i])
+        yield section
+
+
+def stream_sections_json(doc_id: str, csv_file: str) -> Iterator[bytes]:
+    """
+    SectionsList 형태의 JSON을 조각 단위로 생성
+    
+    전체 섹션 목록을 메모리에 만들지 않고 SECTIONS_STREAM_BATCH 행마다
+    orjson으로 인코딩한 조각을 내보냅니다. total은 마지막에 기록합니다.
+    CSV 파일은 첫 조각을 만들 때 열고 생성이 끝나면 닫으므로,
+    응답이 시작되지 않으면 파일도 열리지 않습니다.
+    
+    응답 상태 코드가 이미 전송된 뒤이므로 response_model 검증 대신 행마다 SectionInfo로 검증하고,
+    잘못된 행을 만나면 그때까지의 섹션으로 배열을 닫고 error 필드를 붙여 JSON 형태를 유지합니다.
+    """
+    with open(csv_file, "r", newline="", encoding="utf-8") as f:
+        head = orjson.dumps({
+            "status": 200,
+            "message": "섹션 목록 조회 성공",
+            "timestamp": utc_now(),
+            "doc_id": doc_id,
+        })
+        yield head[:-1] + b',"sections":['
+        
+        total = 0
+        batch = []
+        error = None
+        try:
+            for section in iter_sections_csv(f):
+                SectionInfo.model_validate(section)
+                batch.append(orjson.dumps(section))
+                if len(batch) >= SECTIONS_STREAM_BATCH:
+                    yield (b"," if total else b"") + b",".join(batch)
+                    total += len(batch)
+                    batch = []
+        except (ValueError, csv.Error) as e:
+            error = f"{total + len(batch) + 1}번째 섹션 행 변환 실패: {e}"
+            logger.error(f"섹션 CSV 스트리밍 중단: {doc_id}, {error}")
+        
+        if batch:
+            yield (b"," if total else b"") + b",".join(batch)
+            total += len(batch)
+        
+        tail = b'],"total":' + str(total).encode()
+        if error is not None:
+            tail += b',"error":' + orjson.dumps(error)
+        yield tail + b"}"
+
+
+@lru_cache(maxsize=2048)
+def load_section_json(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    섹션 JSON 메타데이터 로드
+    
+    mtime_ns는 캐시 키로만 사용되어 파일이 변경되면 다시 읽습니다.
+    반환된 dict는 캐시와 공유되므로 수정하지 않아야 합니다.
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+@lru_cache(maxsize=2048)
+def load_section_text(path: str, mtime_ns: int) -> str:
+    """
+    섹션 텍스트 본문 로드
+    
+    mtime_ns는 캐시 키로만 사용되어 파일이 변경되면 다시 읽습니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def conditional_file_response(
+    request: Request,
+    path: str,
+    stat_result: os.stat_result,
+    filename: str,
+    media_type: str
+) -> Response:
+    """
+    조건부 GET을 지원하는 파일 응답 생성
+    
+    미리 조회한 stat_result로 ETag/Last-Modified 헤더를 설정하고,
+    요청의 If-None-Match가 현재 ETag와 일치하면 본문 없이 304를 반환합니다.
+    """
+    response = FileResponse(
+        path=path,
+        filename=filename,
+        media_type=media_type,
+        stat_result=stat_result,
+        headers={"Cache-Control": DOWNLOAD_CACHE_CONTROL}
+    )
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = response.headers["etag"]
+        if any(tag.strip() in (etag, "*") for tag in if_none_match.split(",")):
+            return Response(
+                status_code=304,
+                headers={
+                    name: response.headers[name]
+                    for name in ("etag", "last-modified", "cache-control")
+                }
+            )
+    
+    return response
+
 
 @router.get("/", response_model=DocumentList)
 async def list_documents(
@@ -34,43 +268,46 @@ async def list_documents(
         # 출력 디렉토리에서 문서 검색
         output_dir = settings.OUTPUT_DIR
         documents = []
+        total = 0
         
         if os.path.exists(output_dir):
-            for item in os.listdir(output_dir):
-                item_path = os.path.join(output_dir, item)
-                if os.path.isdir(item_path):
-                    # 문서 ID 디렉토리 발견
-                    doc_id = item
-                    
-                    # CSV 파일 존재 여부로 파싱 완료 확인
-                    csv_file = os.path.join(output_dir, f"{doc_id}_parsed.csv")
-                    status = "parsed" if os.path.exists(csv_file) else "uploaded"
-                    
-                    try:
-                        # MCP로 문서 정보 조회
-                        doc_info = await pdf_get_info(doc_id)
-                        page_count = doc_info.get("page_count", 0)
-                        file_size = doc_info.get("file_size")
-                    except Exception:
-                        # MCP 조회 실패 시 기본값
-                        page_count = 0
-                        file_size = None
-                    
-                    documents.append(DocumentInfo(
-                        doc_id=doc_id,
-                        filename=f"{doc_id}.pdf",
-                        page_count=page_count,
-                        file_size=file_size,
-                        upload_date=None,  # TODO: 실제 업로드 날짜 추가
-                        status=status
-                    ))
-        
-        # 페이징 적용
-        total = len(documents)
-        paginated_docs = documents[skip:skip + limit]
+            # 디렉토리 1회 스캔으로 문서 디렉토리와 CSV 파일 목록 수집
+            doc_dirs, csv_names = scan_output_dir(output_dir)
+            
+            # 페이징 먼저 적용 (정렬로 순서 고정) - 현재 페이지 문서만 MCP 조회
+            doc_dirs.sort()
+            total = len(doc_dirs)
+            page_ids = doc_dirs[skip:skip + limit]
+            
+            # MCP로 문서 정보 동시 조회 (캐시 적중 시 호출 생략)
+            infos = await asyncio.gather(
+                *(pdf_get_info(doc_id) for doc_id in page_ids),
+                return_exceptions=True
+            )
+            
+            for doc_id, doc_info in zip(page_ids, infos):
+                # CSV 파일 존재 여부로 파싱 완료 확인
+                status = "parsed" if f"{doc_id}_parsed.csv" in csv_names else "uploaded"
+                
+                if isinstance(doc_info, Exception):
+                    # MCP 조회 실패 시 기본값
+                    page_count = 0
+                    file_size = None
+                else:
+                    page_count = doc_info.get("page_count", 0)
+                    file_size = doc_info.get("file_size")
+                
+                documents.append(DocumentInfo(
+                    doc_id=doc_id,
+                    filename=f"{doc_id}.pdf",
+                    page_count=page_count,
+                    file_size=file_size,
+                    upload_date=None,  # TODO: 실제 업로드 날짜 추가
+                    status=status
+                ))
         
         return DocumentList(
-            documents=paginated_docs,
+            documents=documents,
             total=total
         )
         
@@ -91,7 +328,7 @@ async def get_document_info(doc_id: str):
         doc_info = await pdf_get_info(doc_id)
         
         # 파싱 상태 확인
-        csv_file = os.path.join(settings.OUTPUT_DIR, f"{doc_id}_parsed.csv")
+        csv_file = parsed_csv_path(doc_id)
         status = "parsed" if os.path.exists(csv_file) else "uploaded"
         
         return DocumentInfo(
@@ -114,45 +351,31 @@ async def get_document_sections(doc_id: str):
     문서 섹션 목록 조회
     
     파싱 완료된 문서의 모든 섹션 목록을 반환합니다.
+    섹션이 많은 문서도 메모리에 모두 올리지 않도록 JSON을 스트리밍합니다.
     """
     try:
         # CSV 파일 확인
-        csv_file = os.path.join(settings.OUTPUT_DIR, f"{doc_id}_parsed.csv")
-        if not os.path.exists(csv_file):
+        csv_file = parsed_csv_path(doc_id)
+        if not os.path.isfile(csv_file):
             raise HTTPException(
                 status_code=404, 
                 detail=f"문서 {doc_id}는 아직 파싱되지 않았습니다."
             )
         
-        # CSV 파일에서 섹션 정보 읽기
-        import csv
-        sections = []
-        
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                sections.append({
-                    "section_id": int(row.get("section_id", 0)),
-                    "level_1": row.get("level_1", ""),
-                    "level_2": row.get("level_2", ""),
-                    "level_3": row.get("level_3", ""),
-                    "kwan": row.get("kwan", ""),
-                    "jo": row.get("jo", ""),
-                    "page_start": int(row.get("page_start", 0)),
-                    "page_end": int(row.get("page_end", 0)),
-                    "title": row.get("title", ""),
-                    "para_count": int(row.get("para_count", 0)),
-                    "char_count": int(row.get("char_count", 0)),
-                    "has_table": row.get("has_table", "").lower() == "true",
-                    "has_figure": row.get("has_figure", "").lower() == "true",
-                    "extract_path": row.get("extract_path"),
-                    "json_path": row.get("json_path")
-                })
-        
-        return SectionsList(
-            doc_id=doc_id,
-            sections=sections,
-            total=len(sections)
+        # 응답을 시작하기 전에 헤더 확인 (스트리밍 중에는 상태 코드를 바꿀 수 없음)
+        header = await asyncio.to_thread(read_sections_csv_header, csv_file)
+        missing = _SECTION_CSV_REQUIRED.difference(header)
+        if missing:
+            raise HTTPException(
+                status_code=500,
+                detail=f"섹션 CSV 형식 오류: 필수 컬럼 누락 {sorted(missing)}"
+            )
+        
+        # CSV 파일에서 섹션 정보를 읽으며 바로 스트리밍
+        # (동기 제너레이터라 파일 열기/읽기는 스레드 풀에서 실행됨)
+        return StreamingResponse(
+            stream_sections_json(doc_id, csv_file),
+            media_type="application/json"
         )
         
     except HTTPException:
@@ -171,25 +394,28 @@ async def get_section_detail(doc_id: str, section_id: int):
     """
     try:
         # 섹션 JSON 파일 경로
-        section_dir = os.path.join(settings.OUTPUT_DIR, doc_id)
-        json_file = os.path.join(section_dir, f"section_{section_id}.json")
-        text_file = os.path.join(section_dir, f"section_{section_id}.txt")
+        json_rel = f"{doc_id}/section_{section_id}.json"
+        text_rel = f"{doc_id}/section_{section_id}.txt"
+        json_file = output_path(json_rel)
+        text_file = output_path(text_rel)
         
-        if not os.path.exists(json_file):
+        try:
+            json_mtime = os.stat(json_file).st_mtime_ns
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=404,
                 detail=f"섹션 {section_id}를 찾을 수 없습니다."
             )
         
-        # JSON 메타데이터 읽기
-        with open(json_file, "r", encoding="utf-8") as f:
-            section_data = json.load(f)
+        # JSON 메타데이터 읽기 (파일이 바뀌지 않았으면 캐시 사용)
+        section_data = load_section_json(json_file, json_mtime)
         
         # 텍스트 본문 읽기
         content = ""
-        if os.path.exists(text_file):
-            with open(text_file, "r", encoding="utf-8") as f:
-                content = f.read()
+        try:
+            content = load_section_text(text_file, os.stat(text_file).st_mtime_ns)
+        except FileNotFoundError:
+            pass
         
         # 섹션 기본 정보 구성
         section_info = {
@@ -206,8 +432,8 @@ async def get_section_detail(doc_id: str, section_id: int):
             "char_count": section_data.get("char_count", 0),
             "has_table": section_data.get("has_table", False),
             "has_figure": section_data.get("has_figure", False),
-            "extract_path": os.path.relpath(text_file, settings.OUTPUT_DIR),
-            "json_path": os.path.relpath(json_file, settings.OUTPUT_DIR)
+            "extract_path": text_rel,
+            "json_path": json_rel
         }
         
         # 추가 메타데이터 (JSON 파일의 나머지 정보)
@@ -228,44 +454,52 @@ async def get_section_detail(doc_id: str, section_id: int):
 
 
 @router.get("/{doc_id}/download/csv")
-async def download_csv(doc_id: str):
+async def download_csv(doc_id: str, request: Request):
     """
     파싱 결과 CSV 파일 다운로드
     
     문서의 파싱 결과를 CSV 파일로 다운로드합니다.
     """
-    csv_file = os.path.join(settings.OUTPUT_DIR, f"{doc_id}_parsed.csv")
+    csv_file = parsed_csv_path(doc_id)
     
-    if not os.path.exists(csv_file):
+    try:
+        stat_result = os.stat(csv_file)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail=f"문서 {doc_id}의 CSV 파일을 찾을 수 없습니다."
         )
     
-    return FileResponse(
+    return conditional_file_response(
+        request,
         path=csv_file,
+        stat_result=stat_result,
         filename=f"{doc_id}_parsed.csv",
         media_type="text/csv"
     )
 
 
 @router.get("/{doc_id}/sections/{section_id}/download/text")
-async def download_section_text(doc_id: str, section_id: int):
+async def download_section_text(doc_id: str, section_id: int, request: Request):
     """
     섹션 텍스트 파일 다운로드
     
     특정 섹션의 본문을 텍스트 파일로 다운로드합니다.
     """
-    text_file = os.path.join(settings.OUTPUT_DIR, doc_id, f"section_{section_id}.txt")
+    text_file = output_path(f"{doc_id}/section_{section_id}.txt")
     
-    if not os.path.exists(text_file):
+    try:
+        stat_result = os.stat(text_file)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail=f"섹션 {section_id}의 텍스트 파일을 찾을 수 없습니다."
         )
     
-    return FileResponse(
+    return conditional_file_response(
+        request,
         path=text_file,
+        stat_result=stat_result,
         filename=f"{doc_id}_section_{section_id}.txt",
         media_type="text/plain"
     )
@@ -279,17 +513,16 @@ async def delete_document(doc_id: str):
     문서와 관련된 모든 파싱 결과를 삭제합니다.
     """
     try:
-        import shutil
-        
         # 문서 디렉토리 경로
-        doc_dir = os.path.join(settings.OUTPUT_DIR, doc_id)
-        csv_file = os.path.join(settings.OUTPUT_DIR, f"{doc_id}_parsed.csv")
+        doc_dir = output_path(doc_id)
+        csv_file = parsed_csv_path(doc_id)
         
         deleted_items = []
         
         # 문서 디렉토리 삭제
         if os.path.exists(doc_dir):
-            shutil.rmtree(doc_dir)
+            # 섹션 파일이 많은 디렉토리 삭제는 이벤트 루프를 막지 않도록 스레드에서 실행
+            await asyncio.to_thread(shutil.rmtree, doc_dir, ignore_errors=True)
             deleted_items.append(f"디렉토리: {doc_dir}")
         
         # CSV 파일 삭제
@@ -303,6 +536,8 @@ async def delete_document(doc_id: str):
                 detail=f"문서 {doc_id}를 찾을 수 없습니다."
             )
         
+        invalidate_doc_info(doc_id)
+        
         logger.info(f"문서 삭제 완료: {doc_id}, 삭제된 항목: {deleted_items}")
         
         return BaseResponse(
@@ -325,29 +560,48 @@ async def upload_document(file: UploadFile = File(...)):
     새로운 PDF 문서를 업로드합니다.
     """
     try:
-        # 파일 확장자 검증
-        if not file.filename.lower().endswith('.pdf'):
+        # 파일 확장자 검증 (확장자 부분만 소문자 변환)
+        doc_id, _, ext = file.filename.rpartition(".")
+        if ext.lower() not in ALLOWED_UPLOAD_EXTENSIONS:
             raise HTTPException(
                 status_code=400,
                 detail="PDF 파일만 업로드 가능합니다."
             )
         
-        # 파일 크기 검증
-        content = await file.read()
-        if len(content) > settings.MAX_FILE_SIZE:
+        # 파일명에서 생성한 doc_id 검증 (업로드 디렉토리 밖 경로 차단)
+        if not doc_id or doc_id.startswith(".") or any(sep in doc_id for sep in "/\\"):
             raise HTTPException(
-                status_code=413,
-                detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_FILE_SIZE // (1024*1024)}MB까지 가능합니다."
+                status_code=400,
+                detail="유효하지 않은 파일명입니다."
             )
         
-        # 파일명에서 doc_id 생성 (확장자 제거)
-        doc_id = os.path.splitext(file.filename)[0]
-        
-        # 업로드 디렉토리에 저장
+        # 업로드 디렉토리에 저장 (청크 단위 스트리밍, 임시 파일에 쓴 뒤 교체)
         upload_path = os.path.join(settings.UPLOAD_DIR, f"{doc_id}.pdf")
+        partial_path = f"{upload_path}.part"
+        file_size = 0
+        
+        try:
+            async with aiofiles.open(partial_path, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    
+                    # 파일 크기 검증
+                    if file_size > settings.MAX_FILE_SIZE:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_FILE_SIZE // (1024*1024)}MB까지 가능합니다."
+                        )
+                    
+                    await out.write(chunk)
+            
+            os.replace(partial_path, upload_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
         
-        with open(upload_path, "wb") as f:
-            f.write(content)
+        # 같은 doc_id로 재업로드된 경우 이전 문서 정보 폐기
+        invalidate_doc_info(doc_id)
         
         # MCP로 문서 정보 확인 (페이지 수 등)
         try:
@@ -356,12 +610,12 @@ async def upload_document(file: UploadFile = File(...)):
         except Exception:
             page_count = None
         
-        logger.info(f"파일 업로드 성공: {doc_id}, 크기: {len(content)}bytes")
+        logger.info(f"파일 업로드 성공: {doc_id}, 크기: {file_size}bytes")
         
         return UploadResponse(
             doc_id=doc_id,
             filename=file.filename,
-            file_size=len(content),
+            file_size=file_size,
             page_count=page_count
         )
         
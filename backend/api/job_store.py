@@ -0,0 +1,44 @@
+"""
+파싱 작업 메모리 저장소
+"""
+from collections import Counter
+from typing import Dict, Any
+
+
+class JobStore:
+    """
+    작업 상태별 개수를 함께 관리하는 메모리 작업 저장소
+
+    작업 등록/갱신 시 상태 카운터를 같이 갱신하므로 상태별 개수 조회가 O(1)입니다.
+    작업 상태를 바꿀 때는 저장된 dict를 직접 수정하지 말고 다시 할당해야 합니다.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.counts: Counter = Counter()
+
+    def __setitem__(self, job_id: str, job: Dict[str, Any]) -> None:
+        old = self.jobs.get(job_id)
+        if old is not None:
+            self.counts[old.get("status")] -= 1
+        self.jobs[job_id] = job
+        self.counts[job.get("status")] += 1
+
+    def __getitem__(self, job_id: str) -> Dict[str, Any]:
+        return self.jobs[job_id]
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.jobs
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def summary(self) -> Dict[str, Any]:
+        """작업 목록과 상태별 개수 반환"""
+        return {
+            "active_jobs": self.jobs,
+            "total": len(self.jobs),
+            "running": self.counts["running"],
+            "completed": self.counts["completed"],
+            "failed": self.counts["failed"],
+        }
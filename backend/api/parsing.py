@@ -1,28 +1,63 @@
 """
 GPT-5 전용 PDF 파싱 API
 """
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Any, AsyncIterator, Dict, List, Set
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from ..clients.openrouter_client import openrouter_chat
+from ..config import settings
+from ..langgraph.graph import run_parsing_flow_with_stream
+from ..models.state import JobStatus
+from .job_store import JobStore
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/parse", tags=["파싱"])
 
 # 간단한 메모리 저장소
-active_jobs: Dict[str, Dict[str, Any]] = {}
+active_jobs = JobStore()
+
+# 문서 분석 프롬프트 템플릿
+ANALYSIS_PROMPT = """
+문서 ID '{doc_id}'에 대한 보험약관 PDF 파싱을 시작합니다.
+
+분석할 항목:
+1. 목차 구조 식별
+2. 보험약관 섹션 분석
+3. 제관/제조 체계 파악
+
+JSON 형식으로 응답해주세요:
+{{
+    "doc_id": "{doc_id}",
+    "analysis_status": "completed",
+    "identified_sections": ["섹션1", "섹션2"],
+    "confidence": 0.95
+}}
+"""
+
+# 고급 분석 프롬프트 템플릿
+ADVANCED_ANALYSIS_PROMPT = """
+문서 ID '{doc_id}'에 대한 고급 보험약관 분석을 수행합니다.
+
+고급 분석 항목:
+1. 복잡한 계층 구조 분석
+2. 법적 조항 간 관계 분석
+3. 리스크 조항 식별
+4. 보장 범위 매핑
+5. 예외 조항 분석
+
+상세한 JSON 분석 결과를 제공해주세요.
+"""
 
 
 @router.get("/jobs")
 async def list_active_jobs():
     """활성 작업 목록 조회"""
     return {
-        "active_jobs": active_jobs,
-        "total": len(active_jobs),
-        "running": len([j for j in active_jobs.values() if j.get("status") == "running"]),
-        "completed": len([j for j in active_jobs.values() if j.get("status") == "completed"]),
-        "failed": len([j for j in active_jobs.values() if j.get("status") == "failed"]),
+        **active_jobs.summary(),
         "message": "작업 목록 조회 성공"
     }
 
@@ -34,22 +69,7 @@ async def start_parsing(doc_id: str):
         logger.info(f"GPT-5 파싱 시작: {doc_id}")
         
         # GPT-5-mini로 문서 분석 테스트
-        analysis_prompt = f"""
-        문서 ID '{doc_id}'에 대한 보험약관 PDF 파싱을 시작합니다.
-        
-        분석할 항목:
-        1. 목차 구조 식별
-        2. 보험약관 섹션 분석
-        3. 제관/제조 체계 파악
-        
-        JSON 형식으로 응답해주세요:
-        {{
-            "doc_id": "{doc_id}",
-            "analysis_status": "completed",
-            "identified_sections": ["섹션1", "섹션2"],
-            "confidence": 0.95
-        }}
-        """
+        analysis_prompt = ANALYSIS_PROMPT.format(doc_id=doc_id)
         
         ai_response = openrouter_chat(
             prompt=analysis_prompt,
@@ -99,6 +119,167 @@ async def get_parsing_status(doc_id: str):
     }
 
 
+def _progress_event(node: Any, state: Dict[str, Any], new_logs: list) -> bytes:
+    """노드 실행 결과를 SSE 이벤트로 변환 (스팬/섹션 본문 등 대용량 필드는 제외)"""
+    payload = {
+        "node": node,
+        "doc_id": state.get("doc_id"),
+        "job_status": state.get("job_status"),
+        "toc_pages": state.get("toc_pages", []),
+        "section_count": len(state.get("sections") or []),
+        "csv_path": state.get("csv_path"),
+        "error": state.get("error"),
+        "logs": new_logs,
+        "updated_at": state.get("updated_at"),
+    }
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+class _ParseProgress:
+    """
+    실행 중인 파싱 작업의 진행 이벤트 기록
+    
+    실행 중에는 이벤트를 모두 보관하므로 늦게 연결하거나 재연결한 구독자도 처음부터 다시 받고,
+    구독자 연결이 끊겨도 파싱 작업에는 영향이 없습니다.
+    작업이 끝나고 구독자가 모두 떠나면 마지막 end 이벤트만 남깁니다.
+    """
+    
+    def __init__(self):
+        self.events: List[bytes] = []
+        self.done = False
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+    
+    def publish(self, event: bytes, done: bool = False) -> None:
+        """이벤트 추가 후 대기 중인 구독자 깨우기"""
+        self.events.append(event)
+        self.done = self.done or done
+        self._changed.set()
+        self._changed = asyncio.Event()
+    
+    async def subscribe(self) -> AsyncIterator[bytes]:
+        """지금까지의 이벤트를 보낸 뒤 작업이 끝날 때까지 새 이벤트 전달"""
+        sent = 0
+        self.subscribers += 1
+        try:
+            while True:
+                changed = self._changed
+                while sent < len(self.events):
+                    yield self.events[sent]
+                    sent += 1
+                if self.done:
+                    return
+                await changed.wait()
+        finally:
+            self.subscribers -= 1
+            self.compact()
+    
+    def compact(self) -> None:
+        """작업이 끝났고 구독자가 없으면 중간 이벤트를 버리고 end 이벤트만 보관"""
+        if self.done and self.subscribers == 0:
+            self.events = self.events[-1:]
+
+
+# 문서별 최근 파싱 진행 기록 / 실행 중인 파싱 태스크 (GC로 취소되지 않도록 참조 유지)
+_progress: Dict[str, _ParseProgress] = {}
+_parse_tasks: Set[asyncio.Task] = set()
+
+
+async def _run_parse_job(doc_id: str, window_size: int, progress: _ParseProgress) -> None:
+    """파싱 그래프를 실행하며 노드가 끝날 때마다 진행 상황 이벤트 기록"""
+    state: Dict[str, Any] = {}
+    error = None
+    try:
+        sent_logs = 0  # 지금까지 전송한 로그 수 (상태에서 제거된 로그 포함)
+        async for update in run_parsing_flow_with_stream(doc_id, window_size=window_size):
+            # astream 결과는 {노드명: 상태}, 플로우 자체가 실패하면 에러 상태가 그대로 전달됨
+            if "job_status" in update:
+                node, state = None, update
+            else:
+                node, state = next(iter(update.items()))
+            
+            # 상태에는 최근 로그만 남으므로 제거된 로그 수를 빼고 새 로그 위치 계산
+            logs = state.get("logs", [])
+            dropped = state.get("dropped_logs", 0)
+            progress.publish(_progress_event(node, state, logs[max(0, sent_logs - dropped):]))
+            sent_logs = dropped + len(logs)
+    except asyncio.CancelledError:
+        error = "파싱 작업 취소"
+        raise
+    except Exception as e:
+        logger.error(f"스트리밍 파싱 실패: {doc_id}, {e}")
+        error = str(e)
+    finally:
+        # 어떤 경우에도 최종 상태 기록 (상태 조회 API와 공유)
+        completed = error is None and state.get("job_status") == JobStatus.COMPLETED
+        active_jobs[doc_id] = {
+            "status": "completed" if completed else "failed",
+            "doc_id": doc_id,
+            "csv_path": state.get("csv_path"),
+            "error": error or state.get("error"),
+            "message": "파싱 완료" if completed else "파싱 실패"
+        }
+        progress.publish(b"event: end\ndata: " + orjson.dumps(active_jobs[doc_id]) + b"\n\n", done=True)
+        progress.compact()
+
+
+def _is_running(doc_id: str) -> bool:
+    """해당 문서의 파싱 작업이 실행 중인지 여부"""
+    return doc_id in active_jobs and active_jobs[doc_id].get("status") == "running"
+
+
+@router.post("/stream/{doc_id}", status_code=202)
+async def start_stream_parsing(doc_id: str, window_size: int = settings.WINDOW_SIZE):
+    """
+    파싱 그래프를 백그라운드 작업으로 시작
+    
+    진행 상황은 GET /parse/stream/{doc_id}로 구독합니다.
+    같은 문서의 파싱이 실행 중이면 409를 반환합니다.
+    """
+    if _is_running(doc_id):
+        raise HTTPException(status_code=409, detail=f"문서 {doc_id}의 파싱이 이미 실행 중입니다")
+    
+    logger.info(f"스트리밍 파싱 시작: {doc_id}")
+    active_jobs[doc_id] = {"status": "running", "doc_id": doc_id, "message": "파싱 진행 중"}
+    
+    progress = _progress[doc_id] = _ParseProgress()
+    task = asyncio.create_task(_run_parse_job(doc_id, window_size, progress))
+    _parse_tasks.add(task)
+    task.add_done_callback(_parse_tasks.discard)
+    
+    return {
+        "doc_id": doc_id,
+        "status": "running",
+        "stream_url": f"{settings.API_V1_STR}/parse/stream/{doc_id}",
+        "message": "파싱 시작"
+    }
+
+
+@router.get("/stream/{doc_id}")
+async def stream_parsing(doc_id: str):
+    """
+    파싱 진행 상황 SSE 구독
+    
+    LangGraph 노드가 끝날 때마다 상태 요약을 text/event-stream 이벤트로 전송하므로
+    클라이언트가 상태 조회 API를 폴링하지 않아도 됩니다.
+    파싱을 시작하지 않으므로 EventSource가 재연결해도 중복 실행되지 않고, 이벤트를 처음부터 다시 받습니다.
+    작업이 끝난 뒤 연결하면 최종 결과(end 이벤트)만 받습니다.
+    """
+    if doc_id not in _progress:
+        raise HTTPException(status_code=404, detail=f"문서 {doc_id}의 파싱 작업을 찾을 수 없습니다")
+    
+    return StreamingResponse(
+        _progress[doc_id].subscribe(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            # GZip 미들웨어가 이벤트를 버퍼링하지 않도록 압축 제외
+            "Content-Encoding": "identity",
+        }
+    )
+
+
 @router.get("/test-gpt5")
 async def test_gpt5():
     """GPT-5 연결 테스트"""
@@ -129,18 +310,7 @@ async def advanced_parsing(doc_id: str):
         logger.info(f"GPT-5 고급 파싱 시작: {doc_id}")
         
         # GPT-5 (고급 모델)로 복잡한 분석
-        advanced_prompt = f"""
-        문서 ID '{doc_id}'에 대한 고급 보험약관 분석을 수행합니다.
-        
-        고급 분석 항목:
-        1. 복잡한 계층 구조 분석
-        2. 법적 조항 간 관계 분석  
-        3. 리스크 조항 식별
-        4. 보장 범위 매핑
-        5. 예외 조항 분석
-        
-        상세한 JSON 분석 결과를 제공해주세요.
-        """
+        advanced_prompt = ADVANCED_ANALYSIS_PROMPT.format(doc_id=doc_id)
         
         ai_response = openrouter_chat(
             prompt=advanced_prompt,
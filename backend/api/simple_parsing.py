@@ -2,27 +2,23 @@
 간단한 PDF 파싱 API (오류 해결용)
 """
 import logging
-from typing import Dict, Any
 from fastapi import APIRouter
 from ..clients.openrouter_client import openrouter_chat
+from .job_store import JobStore
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/parse", tags=["파싱"])
 
 # 간단한 메모리 저장소
-simple_jobs: Dict[str, Dict[str, Any]] = {}
+simple_jobs = JobStore()
 
 
 @router.get("/jobs")
 async def get_jobs():
     """활성 작업 목록 조회"""
     return {
-        "active_jobs": simple_jobs,
-        "total": len(simple_jobs),
-        "running": len([j for j in simple_jobs.values() if j.get("status") == "running"]),
-        "completed": len([j for j in simple_jobs.values() if j.get("status") == "completed"]),
-        "failed": len([j for j in simple_jobs.values() if j.get("status") == "failed"]),
+        **simple_jobs.summary(),
         "message": "작업 목록 조회 성공"
     }
 
@@ -1,20 +1,134 @@
 """
 시스템 관리 관련 API 엔드포인트
 """
+import asyncio
 import logging
+import os
+import shutil
+from functools import lru_cache
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException
+from cachetools import TTLCache
 
 from ..models.schemas import HealthCheck, SystemInfo, ParsingStats, BaseResponse
 from ..config import settings
 from ..langgraph.graph import default_manager
 from ..clients.mcp_client import mcp_call
 from ..clients.openrouter_client import get_available_models
+from ..clients.llm_cache import llm_cache
+from ..clients.semantic_cache import semantic_cache, content_semantic_cache
+from .documents import scan_output_dir
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/system", tags=["시스템관리"])
 
+# 헬스체크 결과 캐시 (동시 요청은 락으로 한 번만 점검)
+_health_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.HEALTH_CACHE_TTL)
+_health_lock = asyncio.Lock()
+
+# 캐시 정리 대상 임시 파일명 표식
+CACHE_NAME_MARKERS = ("parsing-graph", "langgraph")
+
+# 설정 재로드 동시 실행 방지 락
+_config_lock = asyncio.Lock()
+
+
+@lru_cache(maxsize=4096)
+def count_csv_rows(path: str, mtime_ns: int, size: int) -> int:
+    """
+    CSV 데이터 행 수 계산
+    
+    CSV를 파싱하지 않고 바이트 단위 개행 수로 행 수를 셉니다 (헤더 제외).
+    mtime_ns/size는 캐시 키로만 사용되어 파일이 변경되면 다시 계산됩니다.
+    
+    Args:
+        path: CSV 파일 경로
+        mtime_ns: 파일 수정 시간 (ns)
+        size: 파일 크기 (bytes)
+        
+    Returns:
+        헤더를 제외한 행 수
+    """
+    newlines = 0
+    last_byte = b"\n"
+    
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(1 << 20):
+            newlines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    
+    # 마지막 줄에 개행이 없는 경우 보정
+    if last_byte != b"\n":
+        newlines += 1
+    
+    return max(newlines - 1, 0)
+
+
+async def _probe_openrouter() -> str:
+    """OpenRouter API 상태 확인"""
+    # 허용 모델 설정 확인 (로컬 설정 조회로 외부 API 호출 없음)
+    available_models = get_available_models()
+    return "healthy" if available_models else "unhealthy"
+
+
+async def _probe_mcp_server() -> str:
+    """MCP 서버 상태 확인"""
+    # MCP 서버 ping 테스트 (실제 구현에 따라 조정 필요)
+    await mcp_call("server.ping", {})
+    return "healthy"
+
+
+async def _probe_langgraph() -> str:
+    """LangGraph 상태 확인"""
+    graph_status = default_manager.get_status()
+    return "healthy" if graph_status["graph_initialized"] else "not_initialized"
+
+
+async def _probe_filesystem() -> str:
+    """파일 시스템 상태 확인"""
+    upload_dir_exists = os.path.exists(settings.UPLOAD_DIR)
+    output_dir_exists = os.path.exists(settings.OUTPUT_DIR)
+    
+    if upload_dir_exists and output_dir_exists:
+        return "healthy"
+    return f"unhealthy: upload_dir={upload_dir_exists}, output_dir={output_dir_exists}"
+
+
+_HEALTH_PROBES = {
+    "openrouter": _probe_openrouter,
+    "mcp_server": _probe_mcp_server,
+    "langgraph": _probe_langgraph,
+    "filesystem": _probe_filesystem,
+}
+
+
+async def _run_health_check() -> HealthCheck:
+    """
+    서비스 상태 점검 실행
+    
+    모든 점검을 동시에 실행하므로 소요 시간은 가장 느린 점검 하나에 맞춰집니다.
+    """
+    results = await asyncio.gather(
+        *(probe() for probe in _HEALTH_PROBES.values()),
+        return_exceptions=True
+    )
+    
+    services = {}
+    overall_status = "healthy"
+    
+    for name, result in zip(_HEALTH_PROBES, results):
+        if isinstance(result, Exception):
+            result = f"unhealthy: {str(result)}"
+        services[name] = result
+        if result.startswith("unhealthy"):
+            overall_status = "degraded"
+    
+    return HealthCheck(
+        status=overall_status,
+        services=services
+    )
+
 
 @router.get("/health", response_model=HealthCheck)
 async def health_check():
@@ -22,57 +136,20 @@ async def health_check():
     시스템 헬스체크
     
     애플리케이션과 연결된 서비스들의 상태를 확인합니다.
+    로드밸런서 폴링으로 외부 서비스에 부하가 가지 않도록 결과를 짧게 캐시합니다.
     """
-    services = {}
-    overall_status = "healthy"
-    
     try:
-        # OpenRouter API 상태 확인
-        try:
-            from ..clients.openrouter_client import openrouter_client
-            # 간단한 API 호출로 연결 테스트
-            available_models = get_available_models()
-            services["openrouter"] = "healthy" if available_models else "unhealthy"
-        except Exception as e:
-            services["openrouter"] = f"unhealthy: {str(e)}"
-            overall_status = "degraded"
+        if "health" in _health_cache:
+            return _health_cache["health"]
         
-        # MCP 서버 상태 확인
-        try:
-            # MCP 서버 ping 테스트 (실제 구현에 따라 조정 필요)
-            await mcp_call("server.ping", {})
-            services["mcp_server"] = "healthy"
-        except Exception as e:
-            services["mcp_server"] = f"unhealthy: {str(e)}"
-            overall_status = "degraded"
-        
-        # LangGraph 상태 확인
-        try:
-            graph_status = default_manager.get_status()
-            services["langgraph"] = "healthy" if graph_status["graph_initialized"] else "not_initialized"
-        except Exception as e:
-            services["langgraph"] = f"unhealthy: {str(e)}"
-            overall_status = "degraded"
-        
-        # 파일 시스템 상태 확인
-        try:
-            import os
-            upload_dir_exists = os.path.exists(settings.UPLOAD_DIR)
-            output_dir_exists = os.path.exists(settings.OUTPUT_DIR)
+        async with _health_lock:
+            # 락 대기 중 다른 요청이 점검을 끝냈으면 그 결과 사용
+            if "health" in _health_cache:
+                return _health_cache["health"]
             
-            if upload_dir_exists and output_dir_exists:
-                services["filesystem"] = "healthy"
-            else:
-                services["filesystem"] = f"unhealthy: upload_dir={upload_dir_exists}, output_dir={output_dir_exists}"
-                overall_status = "degraded"
-        except Exception as e:
-            services["filesystem"] = f"unhealthy: {str(e)}"
-            overall_status = "degraded"
-        
-        return HealthCheck(
-            status=overall_status,
-            services=services
-        )
+            result = await _run_health_check()
+            _health_cache["health"] = result
+            return result
         
     except Exception as e:
         logger.error(f"헬스체크 실행 중 오류: {e}")
@@ -115,9 +192,6 @@ async def get_parsing_stats():
     전체 문서 파싱 통계를 반환합니다.
     """
     try:
-        import os
-        import glob
-        
         output_dir = settings.OUTPUT_DIR
         
         # 총 문서 수 (출력 디렉토리 기준)
@@ -128,31 +202,28 @@ async def get_parsing_stats():
         processing_times = []
         
         if os.path.exists(output_dir):
-            # 문서 디렉토리들 탐색
-            for item in os.listdir(output_dir):
-                item_path = os.path.join(output_dir, item)
-                if os.path.isdir(item_path):
-                    total_documents += 1
-                    
-                    # CSV 파일 존재 여부로 완료 여부 판단
-                    doc_id = item
-                    csv_file = os.path.join(output_dir, f"{doc_id}_parsed.csv")
+            # 문서 디렉토리들 탐색 (디렉토리 1회 스캔)
+            doc_dirs, csv_names = scan_output_dir(output_dir)
+            
+            for doc_id in doc_dirs:
+                total_documents += 1
+                
+                # CSV 파일 존재 여부로 완료 여부 판단
+                csv_name = f"{doc_id}_parsed.csv"
+                
+                if csv_name in csv_names:
+                    completed_parsing += 1
                     
-                    if os.path.exists(csv_file):
-                        completed_parsing += 1
-                        
-                        # 섹션 수 계산
-                        try:
-                            import csv
-                            with open(csv_file, "r", encoding="utf-8") as f:
-                                reader = csv.DictReader(f)
-                                section_count = sum(1 for _ in reader)
-                                total_sections += section_count
-                        except Exception:
-                            pass
-                    else:
-                        # 실패 여부는 로그나 상태 파일로 판단 (단순화)
-                        failed_parsing += 1
+                    # 섹션 수 계산 (파일이 바뀌지 않았으면 캐시 사용)
+                    try:
+                        csv_file = f"{output_dir}/{csv_name}"
+                        stat = os.stat(csv_file)
+                        total_sections += count_csv_rows(csv_file, stat.st_mtime_ns, stat.st_size)
+                    except Exception:
+                        pass
+                else:
+                    # 실패 여부는 로그나 상태 파일로 판단 (단순화)
+                    failed_parsing += 1
         
         # 평균 처리 시간 계산 (실제 구현에서는 로그나 DB에서 가져와야 함)
         average_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0.0
@@ -187,10 +258,9 @@ async def reload_config():
     애플리케이션 설정을 다시 로드합니다.
     """
     try:
-        # 설정 재로드 (실제 구현에서는 더 정교한 로직 필요)
-        from importlib import reload
-        from .. import config
-        reload(config)
+        # 설정 재로드 (settings 인스턴스를 제자리에서 갱신)
+        async with _config_lock:
+            settings.reload()
         
         logger.info("설정 재로드 완료")
         
@@ -214,24 +284,36 @@ async def clear_cache():
     try:
         # 임시 파일 정리
         import tempfile
-        import shutil
         
         temp_dir = tempfile.gettempdir()
-        cleaned_items = []
         
-        # parsing-graph 관련 임시 파일들 정리
-        for item in os.listdir(temp_dir):
-            if "parsing-graph" in item.lower() or "langgraph" in item.lower():
-                item_path = os.path.join(temp_dir, item)
-                try:
-                    if os.path.isfile(item_path):
-                        os.remove(item_path)
-                        cleaned_items.append(item)
-                    elif os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-                        cleaned_items.append(item)
-                except Exception:
-                    pass
+        # parsing-graph 관련 임시 파일들 정리 대상 수집 (scandir의 d_type으로 stat 생략)
+        targets = []
+        with os.scandir(temp_dir) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if not any(marker in name for marker in CACHE_NAME_MARKERS):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    targets.append((entry.name, shutil.rmtree, entry.path))
+                else:
+                    targets.append((entry.name, os.remove, entry.path))
+        
+        # 삭제는 스레드 풀에서 동시에 실행 (이벤트 루프 블로킹 방지)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(remove, path) for _, remove, path in targets),
+            return_exceptions=True
+        )
+        cleaned_items = [
+            item for (item, _, _), result in zip(targets, results)
+            if not isinstance(result, Exception)
+        ]
+        
+        # LLM 응답 캐시 정리
+        await asyncio.to_thread(llm_cache.clear)
+        semantic_cache.clear()
+        content_semantic_cache.clear()
+        cleaned_items.append("llm_cache")
         
         logger.info(f"캐시 정리 완료: {len(cleaned_items)}개 항목 정리")
         
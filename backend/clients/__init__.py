@@ -2,7 +2,7 @@
 외부 서비스 클라이언트 모듈
 """
 
-from .openrouter_client import openrouter_chat, openrouter_client, gpt5_chat, openai_client
+from .openrouter_client import openrouter_chat, openrouter_chat_async, get_openrouter_client, get_llm_client
 from .mcp_client import mcp_call, mcp_call_sync
 
-__all__ = ["openrouter_chat", "openrouter_client", "gpt5_chat", "openai_client", "mcp_call", "mcp_call_sync"]
\ No newline at end of file
+__all__ = ["openrouter_chat", "openrouter_chat_async", "get_openrouter_client", "get_llm_client", "mcp_call", "mcp_call_sync"]
\ No newline at end of file
@@ -0,0 +1,299 @@
+"""
+LLM 응답 캐시
+
+temperature=0 호출은 같은 입력에 같은 응답을 돌려주므로,
+(모델, 프롬프트 버전, 시스템 프롬프트, 프롬프트, temperature) 해시를 키로 원본 응답 문자열을 저장합니다.
+항목은 LLM_CACHE_TTL이 지나면 만료됩니다.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Protocol, Union
+
+import orjson
+from cachetools import TTLCache
+
+from ..config import settings
+
+# 선택적 Redis 백엔드 (redis 패키지 필요)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """캐시 저장소 인터페이스"""
+    
+    def get(self, key: str) -> Optional[str]:
+        ...
+    
+    def set(self, key: str, value: str) -> None:
+        ...
+    
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """프로세스 메모리 LRU 캐시 (TTL 만료)"""
+    
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._cache.get(key)
+    
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._cache[key] = value
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class DiskCacheBackend:
+    """디스크 JSON 파일 캐시 (재시작 후에도 유지)"""
+    
+    def __init__(self, directory: str, ttl: int):
+        self.directory = directory
+        self.ttl = ttl
+    
+    def _path(self, key: str) -> str:
+        # 한 디렉토리에 파일이 몰리지 않도록 키 앞 2자리로 분산
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+    
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = orjson.loads(f.read())
+            # 만료 시각이 없는 이전 형식 항목은 유효한 것으로 취급
+            if entry.get("expires_at", float("inf")) < time.time():
+                return None
+            return entry["response"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"LLM 디스크 캐시 읽기 실패 (무시): {key}, {e}")
+            return None
+    
+    def set(self, key: str, value: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 불완전한 파일을 보지 않도록 함
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps({"response": value, "expires_at": int(time.time()) + self.ttl}))
+        os.replace(tmp_path, path)
+    
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class SqliteCacheBackend:
+    """SQLite 캐시 (단일 파일, 만료 시각 인덱스로 정리)"""
+    
+    def __init__(self, path: str, ttl: int):
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "input_hash TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created_at INTEGER NOT NULL, expires_at INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache (expires_at)")
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE input_hash = ? AND expires_at >= ?",
+                (key, int(time.time()))
+            ).fetchone()
+        return row[0] if row is not None else None
+    
+    def set(self, key: str, value: str) -> None:
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (input_hash, response, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now + self.ttl)
+            )
+            # 만료 항목 정리
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+    
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+
+class RedisCacheBackend:
+    """Redis 캐시 (여러 프로세스/서버 간 공유)"""
+    
+    def __init__(self, url: str, ttl: int, prefix: str = "llm-cache:"):
+        self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+    
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(self.prefix + key)
+        return value.decode("utf-8") if value is not None else None
+    
+    def set(self, key: str, value: str) -> None:
+        self._client.set(self.prefix + key, value.encode("utf-8"), ex=self.ttl)
+    
+    def clear(self) -> None:
+        for redis_key in self._client.scan_iter(f"{self.prefix}*"):
+            self._client.delete(redis_key)
+
+
+class LLMResponseCache:
+    """
+    계층형 LLM 응답 캐시
+    
+    앞쪽 백엔드부터 조회하고, 뒤쪽 백엔드에서 찾은 값은 앞쪽 백엔드에도 채워 넣습니다.
+    """
+    
+    def __init__(self, backends: List[CacheBackend]):
+        self.backends = backends
+        self.hits = 0
+        self.misses = 0
+        # 메모리 외 백엔드(디스크/SQLite/Redis)는 동기 I/O이므로 비동기 호출 시 스레드에서 실행
+        self._blocking = any(not isinstance(backend, MemoryCacheBackend) for backend in backends)
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: Optional[str],
+        prompt: Union[str, List[Dict[str, Any]]],
+        temperature: float,
+        prompt_version: Optional[str] = None
+    ) -> str:
+        """모델/프롬프트 버전/프롬프트/temperature의 SHA-256 캐시 키"""
+        payload = orjson.dumps(
+            {
+                "model": model,
+                "prompt_version": prompt_version,
+                "system": system_prompt,
+                "prompt": prompt,
+                "temperature": temperature
+            },
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha256(payload).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (없으면 None)"""
+        for i, backend in enumerate(self.backends):
+            try:
+                value = backend.get(key)
+            except Exception as e:
+                logger.warning(f"LLM 캐시 조회 실패 (무시): {type(backend).__name__}, {e}")
+                continue
+            
+            if value is not None:
+                for upper in self.backends[:i]:
+                    try:
+                        upper.set(key, value)
+                    except Exception as e:
+                        logger.warning(f"LLM 캐시 저장 실패 (무시): {type(upper).__name__}, {e}")
+                self.hits += 1
+                logger.info(f"LLM 캐시 적중: {key[:12]} (hits={self.hits}, misses={self.misses})")
+                return value
+        
+        self.misses += 1
+        logger.info(f"LLM 캐시 미스: {key[:12]} (hits={self.hits}, misses={self.misses})")
+        return None
+    
+    def set(self, key: str, value: str) -> None:
+        """모든 백엔드에 저장"""
+        for backend in self.backends:
+            try:
+                backend.set(key, value)
+            except Exception as e:
+                logger.warning(f"LLM 캐시 저장 실패 (무시): {type(backend).__name__}, {e}")
+    
+    async def aget(self, key: str) -> Optional[str]:
+        """비동기 캐시 조회 (파일/네트워크 I/O가 있으면 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        if self._blocking:
+            return await asyncio.to_thread(self.get, key)
+        return self.get(key)
+    
+    async def aset(self, key: str, value: str) -> None:
+        """비동기 캐시 저장 (파일/네트워크 I/O가 있으면 스레드에서 실행)"""
+        if self._blocking:
+            await asyncio.to_thread(self.set, key, value)
+        else:
+            self.set(key, value)
+    
+    def clear(self) -> None:
+        """모든 백엔드 비우기"""
+        for backend in self.backends:
+            backend.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """적중/미스 통계"""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _create_backends() -> List[CacheBackend]:
+    """설정(LLM_CACHE_BACKENDS)에 따라 캐시 백엔드 구성"""
+    backends: List[CacheBackend] = []
+    for name in settings.LLM_CACHE_BACKENDS.split(","):
+        name = name.strip()
+        if name == "memory":
+            backends.append(MemoryCacheBackend(settings.LLM_CACHE_MAX_ENTRIES, settings.LLM_CACHE_TTL))
+        elif name == "disk":
+            backends.append(DiskCacheBackend(settings.LLM_CACHE_DIR, settings.LLM_CACHE_TTL))
+        elif name == "sqlite":
+            backends.append(SqliteCacheBackend(settings.LLM_CACHE_SQLITE_PATH, settings.LLM_CACHE_TTL))
+        elif name == "redis":
+            if REDIS_AVAILABLE:
+                backends.append(RedisCacheBackend(settings.REDIS_URL, settings.LLM_CACHE_TTL))
+            else:
+                logger.warning("Redis LLM 캐시를 요청했지만 redis 패키지를 사용할 수 없습니다")
+        elif name:
+            logger.warning(f"알 수 없는 LLM 캐시 백엔드 (무시): {name}")
+    return backends
+
+
+# 전역 LLM 응답 캐시 인스턴스
+llm_cache = LLMResponseCache(_create_backends())
+
+
+def cache_key(
+    prompt: Union[str, List[Dict[str, Any]]],
+    system_prompt: Optional[str],
+    temperature: float,
+    model: str = settings.OPENROUTER_MODEL,
+    prompt_version: Optional[str] = None
+) -> Optional[str]:
+    """
+    결정적 호출의 캐시 키 반환
+    
+    캐시가 꺼져 있거나 temperature > 0이면 None을 반환합니다 (캐시하지 않음).
+    prompt가 메시지 목록이면 시스템 메시지까지 목록 전체가 키에 포함됩니다.
+    prompt_version을 올리면 이전 버전 템플릿으로 만든 항목은 더 이상 조회되지 않습니다.
+    """
+    if not settings.LLM_CACHE_ENABLED or temperature > 0:
+        return None
+    return LLMResponseCache.make_key(model, system_prompt, prompt, temperature, prompt_version)
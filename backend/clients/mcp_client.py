@@ -2,20 +2,172 @@
 MCP (Model Context Protocol) 클라이언트
 JSON-RPC 2.0 기반 통신
 """
+import hashlib
+import itertools
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 import httpx
+import orjson
 import asyncio
+from cachetools import TLRUCache
 from ..config import settings
 
+# 선택적 HTTP/2 지원 (h2 패키지 필요)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# 선택적 brotli 응답 해제 지원 (brotli 패키지 필요)
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# 선택적 msgpack 응답 지원 (msgpack 패키지 필요)
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# msgpack 응답을 요청할 메서드 (숫자 필드가 많은 대용량 응답)
+MCP_MSGPACK_METHODS = frozenset({"pdf.parse_layout_spans"})
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+_MSGPACK_ACCEPT_HEADERS = {"Accept": f"{MSGPACK_CONTENT_TYPE}, application/json;q=0.9"}
+
 
 class MCPClientError(Exception):
     """MCP 클라이언트 예외"""
     pass
 
 
+# 재사용 HTTP 클라이언트 (keep-alive 연결 풀 공유)
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_client: Optional[httpx.Client] = None
+_sync_client_lock = threading.Lock()
+
+# 동시 호출 수 제한 세마포어 (이벤트 루프별로 생성)
+_mcp_semaphore: Optional[asyncio.Semaphore] = None
+_mcp_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _client_limits() -> httpx.Limits:
+    """MCP 연결 풀 한도"""
+    return httpx.Limits(
+        max_connections=settings.MCP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.MCP_MAX_KEEPALIVE_CONNECTIONS
+    )
+
+
+def _client_headers() -> Dict[str, str]:
+    """
+    MCP 공통 요청 헤더
+    
+    큰 스팬 응답의 전송량을 줄이도록 압축 응답을 요청합니다 (httpx가 자동 해제).
+    """
+    return {
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, br" if BROTLI_AVAILABLE else "gzip",
+    }
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    공유 비동기 HTTP 클라이언트 반환
+    
+    최초 사용 시 생성하며, 이벤트 루프가 바뀐 경우(테스트 등) 새 루프에 맞춰 다시 생성합니다.
+    MCP_HTTP2가 켜져 있고 h2가 설치되어 있으면 HTTP/2를 사용합니다 (https에서 ALPN 협상).
+    """
+    global _async_client, _async_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            timeout=settings.MCP_TIMEOUT,
+            limits=_client_limits(),
+            headers=_client_headers(),
+            # HTTP/2 사용 시 동시 요청을 하나의 연결에서 다중화
+            http2=settings.MCP_HTTP2 and HTTP2_AVAILABLE
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+def _get_mcp_semaphore() -> asyncio.Semaphore:
+    """MCP 동시 호출 수 제한 세마포어 반환 (MCP_MAX_CONCURRENCY)"""
+    global _mcp_semaphore, _mcp_semaphore_loop
+    
+    loop = asyncio.get_running_loop()
+    if _mcp_semaphore is None or _mcp_semaphore_loop is not loop:
+        _mcp_semaphore = asyncio.Semaphore(settings.MCP_MAX_CONCURRENCY)
+        _mcp_semaphore_loop = loop
+    return _mcp_semaphore
+
+
+def _get_sync_client() -> httpx.Client:
+    """공유 동기 HTTP 클라이언트 반환"""
+    global _sync_client
+    
+    if _sync_client is None:
+        with _sync_client_lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(
+                    timeout=settings.MCP_TIMEOUT,
+                    limits=_client_limits(),
+                    headers=_client_headers()
+                )
+    return _sync_client
+
+
+async def aclose_clients() -> None:
+    """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+    global _async_client, _async_client_loop, _sync_client, _multiplexer, _multiplexer_loop
+    
+    if _multiplexer is not None:
+        await _multiplexer.aclose()
+        _multiplexer = None
+        _multiplexer_loop = None
+    
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+        _async_client_loop = None
+    
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+
+
+def _rpc_body(method: str, params: Dict[str, Any], request_id: int = 1) -> bytes:
+    """
+    JSON-RPC 2.0 요청 본문 직렬화
+    
+    고정 필드는 미리 만든 바이트를 붙이고 method/params만 직렬화합니다.
+    """
+    return (
+        b'{"jsonrpc":"2.0","id":' + str(request_id).encode()
+        + b',"method":' + orjson.dumps(method)
+        + b',"params":' + orjson.dumps(params) + b"}"
+    )
+
+
+def _rpc_error(error_info: Dict[str, Any], method: Optional[str] = None) -> MCPClientError:
+    """JSON-RPC 2.0 에러 객체를 MCPClientError로 변환 (에러 응답에서만 호출)"""
+    prefix = f"{method}: " if method else ""
+    return MCPClientError(
+        f"MCP 서버 에러: {prefix}{error_info.get('message', 'Unknown error')} "
+        f"(code: {error_info.get('code', 'Unknown')})"
+    )
+
+
 async def mcp_call(
     method: str, 
     params: Dict[str, Any], 
@@ -38,43 +190,250 @@ async def mcp_call(
     if timeout is None:
         timeout = settings.MCP_TIMEOUT
     
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": method,
-        "params": params
-    }
+    # 동시 호출 수 제한 (연결 풀 한도 초과로 인한 연결 생성/해제 반복 방지)
+    async with _get_mcp_semaphore():
+        # 다중화 모드: 동시 호출을 배치 요청으로 묶어 전송
+        if settings.MCP_MULTIPLEX:
+            return await _get_multiplexer().call(method, params, timeout)
+        
+        return await _mcp_post(method, params, timeout)
+
+
+def _decode_response(response: httpx.Response) -> Any:
+    """응답 본문 디코딩 (서버가 msgpack으로 응답한 경우 msgpack, 그 외에는 JSON)"""
+    if MSGPACK_AVAILABLE and response.headers.get("content-type", "").startswith(MSGPACK_CONTENT_TYPE):
+        return msgpack.unpackb(response.content, raw=False)
+    return orjson.loads(response.content)
+
+
+async def _mcp_post(method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """단일 JSON-RPC 요청 전송"""
+    # 대용량 응답 메서드는 msgpack 응답을 우선 요청 (서버가 지원하지 않으면 JSON으로 응답)
+    use_msgpack = MSGPACK_AVAILABLE and method in MCP_MSGPACK_METHODS
     
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
+        response = await _get_async_client().post(
+            f"{settings.MCP_BASE}/mcp",
+            content=_rpc_body(method, params),
+            headers=_MSGPACK_ACCEPT_HEADERS if use_msgpack else None,
+            timeout=timeout
+        )
+        response.raise_for_status()
+        
+        data = _decode_response(response)
+        
+        # JSON-RPC 2.0 에러 체크 (성공 응답에는 result가 항상 존재)
+        error_info = data.get("error")
+        if error_info is not None:
+            raise _rpc_error(error_info)
+        
+        logger.info(f"MCP 호출 성공: {method}")
+        return data["result"]
+            
+    except MCPClientError:
+        raise
+    except httpx.HTTPError as e:
+        logger.error(f"MCP HTTP 에러: {e}")
+        raise MCPClientError(f"MCP 통신 실패: {e}")
+    except Exception as e:
+        logger.error(f"MCP 호출 실패: {e}")
+        raise MCPClientError(f"MCP 예외: {e}")
+
+
+async def mcp_batch(
+    calls: List[Tuple[str, Dict[str, Any]]],
+    timeout: Optional[int] = None,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    JSON-RPC 2.0 배치 MCP 서버 호출
+    
+    여러 호출을 하나의 JSON 배열로 한 번에 전송하고, 응답을 id로 매칭하여
+    요청 순서대로 결과를 반환합니다. 서버가 배치 요청을 지원해야 합니다.
+    
+    Args:
+        calls: (메서드명, 파라미터) 목록
+        timeout: 타임아웃 (초)
+        return_exceptions: True이면 개별 호출 에러를 예외 대신 결과 목록에 MCPClientError로 담음
+    
+    Returns:
+        호출 순서와 같은 순서의 결과 목록
+        
+    Raises:
+        MCPClientError: 통신 실패 또는 (return_exceptions=False일 때) 호출 중 하나라도 에러 응답 시
+    """
+    if not calls:
+        return []
+    
+    if timeout is None:
+        timeout = settings.MCP_TIMEOUT
+    
+    body = b"[" + b",".join(
+        _rpc_body(method, params, i) for i, (method, params) in enumerate(calls)
+    ) + b"]"
+    
+    try:
+        async with _get_mcp_semaphore():
+            response = await _get_async_client().post(
                 f"{settings.MCP_BASE}/mcp",
-                json=payload,
-                headers={"Content-Type": "application/json"}
+                content=body,
+                timeout=timeout
             )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # JSON-RPC 2.0 에러 체크
-            if "error" in data:
-                error_info = data["error"]
-                raise MCPClientError(
-                    f"MCP 서버 에러: {error_info.get('message', 'Unknown error')} "
-                    f"(code: {error_info.get('code', 'Unknown')})"
-                )
-            
-            logger.info(f"MCP 호출 성공: {method}")
-            return data.get("result", {})
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        if not isinstance(data, list):
+            raise MCPClientError(f"MCP 배치 응답 형식 오류: {type(data).__name__}")
+        
+        # 응답 순서는 보장되지 않으므로 id로 역다중화
+        by_id = {item.get("id"): item for item in data}
+        results = []
+        for i, (method, _) in enumerate(calls):
+            item = by_id.get(i)
+            if item is None:
+                error = MCPClientError(f"MCP 배치 응답 누락: {method} (id: {i})")
+            elif item.get("error") is not None:
+                error = _rpc_error(item["error"], method)
+            else:
+                results.append(item["result"])
+                continue
             
+            if not return_exceptions:
+                raise error
+            results.append(error)
+        
+        logger.info(f"MCP 배치 호출 성공: {len(calls)}건")
+        return results
+        
+    except MCPClientError:
+        raise
     except httpx.HTTPError as e:
         logger.error(f"MCP HTTP 에러: {e}")
         raise MCPClientError(f"MCP 통신 실패: {e}")
     except Exception as e:
-        logger.error(f"MCP 호출 실패: {e}")
+        logger.error(f"MCP 배치 호출 실패: {e}")
         raise MCPClientError(f"MCP 예외: {e}")
 
 
+class MCPMultiplexer:
+    """
+    MCP 호출 다중화기
+    
+    mcp_call 요청을 큐에 넣고, 단일 writer 태스크가 그 시점까지 쌓인 요청을
+    JSON-RPC 배치 하나로 묶어 전송합니다. 응답은 id로 각 호출의 Future에 전달됩니다.
+    동시 호출이 몰릴 때 N번의 왕복이 배치 수만큼으로 줄어듭니다. 서버가 배치 요청을 지원해야 합니다.
+    """
+    
+    def __init__(self, max_batch_size: int = 64):
+        self.max_batch_size = max_batch_size
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._ids = itertools.count(1)
+        self._writer: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+    
+    def _ensure_writer(self) -> None:
+        """writer 태스크가 없거나 종료된 경우 시작"""
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain())
+    
+    async def call(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """호출을 큐에 넣고 응답을 대기"""
+        self._ensure_writer()
+        
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        await self.queue.put((request_id, method, params, timeout))
+        
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise MCPClientError(f"MCP 호출 타임아웃: {method} ({timeout}s)")
+        finally:
+            self.pending.pop(request_id, None)
+    
+    async def _drain(self) -> None:
+        """큐에 쌓인 요청을 배치로 묶어 전송 (응답을 기다리지 않고 다음 배치 수집)"""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            
+            task = asyncio.create_task(self._send(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+    
+    async def _send(self, batch: List[Tuple[int, str, Dict[str, Any], float]]) -> None:
+        """배치 전송 후 응답을 id별 Future에 전달"""
+        body = b"[" + b",".join(
+            _rpc_body(method, params, request_id) for request_id, method, params, _ in batch
+        ) + b"]"
+        
+        try:
+            response = await _get_async_client().post(
+                f"{settings.MCP_BASE}/mcp",
+                content=body,
+                timeout=max(timeout for *_, timeout in batch)
+            )
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            if not isinstance(data, list):
+                raise MCPClientError(f"MCP 배치 응답 형식 오류: {type(data).__name__}")
+            
+            for item in data:
+                future = self.pending.get(item.get("id"))
+                if future is None or future.done():
+                    continue
+                
+                error_info = item.get("error")
+                if error_info is not None:
+                    future.set_exception(_rpc_error(error_info))
+                else:
+                    future.set_result(item["result"])
+            
+            logger.info(f"MCP 다중화 배치 전송 성공: {len(batch)}건")
+            error = MCPClientError("MCP 배치 응답 누락")
+        
+        except MCPClientError as e:
+            logger.error(f"MCP 다중화 배치 전송 실패: {e}")
+            error = e
+        except httpx.HTTPError as e:
+            logger.error(f"MCP HTTP 에러: {e}")
+            error = MCPClientError(f"MCP 통신 실패: {e}")
+        except Exception as e:
+            logger.error(f"MCP 다중화 배치 전송 실패: {e}")
+            error = MCPClientError(f"MCP 예외: {e}")
+        
+        # 응답을 받지 못한 호출은 에러로 종료
+        for request_id, *_ in batch:
+            future = self.pending.get(request_id)
+            if future is not None and not future.done():
+                future.set_exception(error)
+    
+    async def aclose(self) -> None:
+        """writer 태스크 종료"""
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+
+
+_multiplexer: Optional[MCPMultiplexer] = None
+_multiplexer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_multiplexer() -> MCPMultiplexer:
+    """현재 이벤트 루프용 MCP 다중화기 반환"""
+    global _multiplexer, _multiplexer_loop
+    
+    loop = asyncio.get_running_loop()
+    if _multiplexer is None or _multiplexer_loop is not loop:
+        _multiplexer = MCPMultiplexer()
+        _multiplexer_loop = loop
+    return _multiplexer
+
+
 def mcp_call_sync(
     method: str, 
     params: Dict[str, Any], 
@@ -97,35 +456,26 @@ def mcp_call_sync(
     if timeout is None:
         timeout = settings.MCP_TIMEOUT
     
-    payload = {
-        "jsonrpc": "2.0", 
-        "id": 1,
-        "method": method,
-        "params": params
-    }
-    
     try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(
-                f"{settings.MCP_BASE}/mcp",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # JSON-RPC 2.0 에러 체크
-            if "error" in data:
-                error_info = data["error"]
-                raise MCPClientError(
-                    f"MCP 서버 에러: {error_info.get('message', 'Unknown error')} "
-                    f"(code: {error_info.get('code', 'Unknown')})"
-                )
-            
-            logger.info(f"MCP 호출 성공: {method}")
-            return data.get("result", {})
+        response = _get_sync_client().post(
+            f"{settings.MCP_BASE}/mcp",
+            content=_rpc_body(method, params),
+            timeout=timeout
+        )
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        
+        # JSON-RPC 2.0 에러 체크 (성공 응답에는 result가 항상 존재)
+        error_info = data.get("error")
+        if error_info is not None:
+            raise _rpc_error(error_info)
+        
+        logger.info(f"MCP 호출 성공: {method}")
+        return data["result"]
             
+    except MCPClientError:
+        raise
     except httpx.HTTPError as e:
         logger.error(f"MCP HTTP 에러: {e}")
         raise MCPClientError(f"MCP 통신 실패: {e}")
@@ -134,20 +484,158 @@ def mcp_call_sync(
         raise MCPClientError(f"MCP 예외: {e}")
 
 
+# 결정적(같은 입력 → 같은 결과) 메서드별 응답 캐시 유지 시간 (초, 0이면 캐시 안 함)
+# pdf.get_info는 문서 목록 API의 캐시를 겸하므로 DOC_INFO_CACHE_TTL을 따름
+MCP_CACHE_TTLS: Dict[str, int] = {
+    "pdf.get_info": settings.DOC_INFO_CACHE_TTL,
+    "pdf.parse_layout_spans": 3600,
+    "pdf.read": 3600,
+}
+
+# MCP 응답 캐시: (doc_id, 호출 해시) -> (ttl, 결과), 항목별 TTL 적용
+_mcp_cache: TLRUCache = TLRUCache(
+    maxsize=4096,
+    ttu=lambda _key, value, now: now + value[0]
+)
+
+
+def _mcp_cache_key(method: str, params: Dict[str, Any]) -> Tuple[Any, str]:
+    """메서드명과 정규화된 파라미터로 캐시 키 생성"""
+    canonical = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.blake2b(method.encode("utf-8") + b":" + canonical, digest_size=16).hexdigest()
+    return params.get("doc_id"), digest
+
+
+async def mcp_call_cached(
+    method: str,
+    params: Dict[str, Any],
+    ttl: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    캐시를 거치는 MCP 서버 호출
+    
+    같은 (메서드, 파라미터) 호출은 TTL 동안 MCP 요청 없이 캐시된 결과를 반환합니다.
+    반환된 결과는 캐시와 공유되므로 수정하지 않아야 합니다.
+    
+    Args:
+        method: 호출할 메서드명
+        params: 메서드 파라미터
+        ttl: 캐시 유지 시간 (초). None이면 MCP_CACHE_TTLS 기준, 0이면 캐시 안 함
+    
+    Returns:
+        MCP 서버 응답 데이터
+    """
+    if ttl is None:
+        ttl = MCP_CACHE_TTLS.get(method, 0)
+    if ttl <= 0:
+        return await mcp_call(method, params)
+    
+    key = _mcp_cache_key(method, params)
+    cached = _mcp_cache.get(key)
+    if cached is not None:
+        return cached[1]
+    
+    result = await mcp_call(method, params)
+    _mcp_cache[key] = (ttl, result)
+    return result
+
+
+def invalidate_mcp_cache(doc_id: str) -> None:
+    """특정 문서의 MCP 응답 캐시 무효화 (재업로드/삭제 시)"""
+    for key in [key for key in list(_mcp_cache.keys()) if key[0] == doc_id]:
+        _mcp_cache.pop(key, None)
+
+
 # 특화된 MCP 호출 함수들
 async def pdf_get_info(doc_id: str) -> Dict[str, Any]:
     """PDF 문서 정보 조회"""
-    return await mcp_call("pdf.get_info", {"doc_id": doc_id})
+    return await mcp_call_cached("pdf.get_info", {"doc_id": doc_id})
 
 
 async def pdf_parse_layout_spans(doc_id: str, pages: list[int]) -> Dict[str, Any]:
     """PDF 스팬 레벨 파싱"""
-    return await mcp_call("pdf.parse_layout_spans", {"doc_id": doc_id, "pages": pages})
+    return await mcp_call_cached("pdf.parse_layout_spans", {"doc_id": doc_id, "pages": pages})
 
 
 async def pdf_read(doc_id: str, pages: list[int], mode: str = "plain") -> Dict[str, Any]:
     """PDF 텍스트 읽기"""
-    return await mcp_call("pdf.read", {"doc_id": doc_id, "pages": pages, "mode": mode})
+    return await mcp_call_cached("pdf.read", {"doc_id": doc_id, "pages": pages, "mode": mode})
+
+
+async def pdf_read_batch(
+    doc_id: str,
+    page_lists: List[List[int]],
+    mode: str = "plain",
+    batch_size: int = 32
+) -> List[Any]:
+    """
+    여러 페이지 범위의 PDF 텍스트를 배치로 읽기
+    
+    캐시에 있는 범위는 재사용하고, 나머지는 batch_size개씩 JSON-RPC 배치로 묶어 동시에 전송합니다.
+    서버가 배치 요청을 처리하지 못하면 개별 pdf.read 호출로 대체합니다.
+    
+    Args:
+        doc_id: 문서 ID
+        page_lists: 범위별 페이지 목록
+        mode: 읽기 모드
+        batch_size: 배치 하나에 담을 최대 범위 수
+    
+    Returns:
+        범위 순서와 같은 순서의 결과 목록 (실패한 범위는 MCPClientError)
+    """
+    ttl = MCP_CACHE_TTLS.get("pdf.read", 0)
+    results: List[Any] = [None] * len(page_lists)
+    pending: List[Tuple[int, Dict[str, Any], str]] = []
+    
+    for index, pages in enumerate(page_lists):
+        params = {"doc_id": doc_id, "pages": pages, "mode": mode}
+        key = _mcp_cache_key("pdf.read", params)
+        cached = _mcp_cache.get(key) if ttl > 0 else None
+        if cached is not None:
+            results[index] = cached[1]
+        else:
+            pending.append((index, params, key))
+    
+    if not pending:
+        return results
+    
+    chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    try:
+        chunk_results = await asyncio.gather(*(
+            mcp_batch([("pdf.read", params) for _, params, _ in chunk], return_exceptions=True)
+            for chunk in chunks
+        ))
+    except MCPClientError as e:
+        logger.warning(f"pdf.read 배치 호출 실패, 개별 호출로 대체: {e}")
+        fallback = await asyncio.gather(
+            *(mcp_call("pdf.read", params) for _, params, _ in pending),
+            return_exceptions=True
+        )
+        chunk_results = [fallback]
+        chunks = [pending]
+    
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        for (index, _, key), result in zip(chunk, chunk_result):
+            results[index] = result
+            if ttl > 0 and not isinstance(result, BaseException):
+                _mcp_cache[key] = (ttl, result)
+    
+    return results
+
+
+async def pdf_read_pages(doc_id: str, pages: List[int], mode: str = "plain") -> Dict[int, Any]:
+    """
+    페이지별 PDF 텍스트 읽기
+    
+    각 페이지를 한 번씩만 읽어 {페이지: 결과} 형태로 반환합니다.
+    페이지 단위 결과는 pdf.read 캐시에 (doc_id, 페이지) 별로 저장되어 다른 섹션/요청에서도 재사용됩니다.
+    
+    Returns:
+        페이지별 결과 (실패한 페이지는 MCPClientError)
+    """
+    unique_pages = sorted(set(pages))
+    results = await pdf_read_batch(doc_id, [[page] for page in unique_pages], mode=mode)
+    return dict(zip(unique_pages, results))
 
 
 async def fs_write_csv(file_path: str, data: list[list], headers: list[str]) -> Dict[str, Any]:
@@ -168,12 +656,26 @@ class MCPConnectionPool:
     async def setup_server(self, server_id: str, server_config: Dict[str, Any]) -> str:
         """MCP 서버 설정 및 연결"""
         try:
-            # 서버 연결 테스트
-            test_result = await mcp_call("server.ping", {}, timeout=10)
+            # 서버 연결 테스트는 도구/리소스 조회를 막지 않도록 짧은 기한으로 병행 실행
+            ping_task = asyncio.create_task(
+                asyncio.wait_for(mcp_call("server.ping", {}, timeout=2), timeout=2)
+            )
+            
+            # 사용 가능한 도구/리소스 조회 (서로 독립적이므로 동시 실행)
+            try:
+                tools, resources = await asyncio.gather(
+                    mcp_call("server.list_tools", {}),
+                    mcp_call("server.list_resources", {})
+                )
+            except Exception:
+                ping_task.cancel()
+                raise
             
-            # 사용 가능한 도구 및 리소스 조회
-            tools = await mcp_call("server.list_tools", {})
-            resources = await mcp_call("server.list_resources", {})
+            try:
+                test_result = await ping_task
+            except (asyncio.TimeoutError, MCPClientError) as e:
+                logger.warning(f"MCP 서버 ping 실패 (무시): {server_id}, {e}")
+                test_result = None
             
             self.connected_servers[server_id] = {
                 "config": server_config,
@@ -1,27 +1,251 @@
 """
 OpenRouter API 클라이언트
 """
+import asyncio
 import logging
-from typing import Optional
-from openai import OpenAI
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from ..config import settings
+from ..prompts.adapters import Messages, adapt_messages
+
+try:
+    import h2  # noqa: F401  httpx HTTP/2 지원 여부 확인
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-# OpenRouter 클라이언트 초기화
-openrouter_client = OpenAI(
-    api_key=settings.OPENROUTER_API_KEY,
-    base_url=settings.OPENROUTER_BASE_URL,
-    default_headers={
-        "HTTP-Referer": settings.OPENROUTER_SITE_URL,
-        "X-Title": settings.OPENROUTER_APP_NAME,
-    }
-)
+# 사용자 프롬프트 문자열 또는 프롬프트 빌더가 만든 메시지 목록
+Prompt = Union[str, Messages]
+
+
+class _LLMClient:
+    """
+    OpenRouter LLM 클라이언트
+    
+    동기/비동기 SDK 클라이언트와 메시지 구성, 모델 검증, 로깅을 한 곳에서 관리합니다.
+    """
+    
+    def __init__(self):
+        default_headers = {
+            "HTTP-Referer": settings.OPENROUTER_SITE_URL,
+            "X-Title": settings.OPENROUTER_APP_NAME,
+        }
+        
+        # 동기 클라이언트
+        self.client = OpenAI(
+            api_key=settings.OPENROUTER_API_KEY,
+            base_url=settings.OPENROUTER_BASE_URL,
+            default_headers=default_headers
+        )
+        
+        # 비동기 클라이언트 (공유 연결 풀)
+        self.async_client = AsyncOpenAI(
+            api_key=settings.OPENROUTER_API_KEY,
+            base_url=settings.OPENROUTER_BASE_URL,
+            default_headers=default_headers,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=settings.LLM_TIMEOUT,
+                http2=HTTP2_AVAILABLE
+            )
+        )
+        
+        # 비동기 동시 호출 수 제한 세마포어 (이벤트 루프별로 생성)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """LLM 동시 호출 수 제한 세마포어 반환 (LLM_MAX_CONCURRENCY)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    @staticmethod
+    def _check_model(model: str) -> None:
+        """
+        허용 모델 검증
+        
+        Raises:
+            ValueError: 허용되지 않은 모델 사용 시
+        """
+        allowed = settings.ALLOWED_MODELS
+        if model not in allowed:
+            raise ValueError(
+                f"모델 '{model}'은 허용되지 않습니다. "
+                f"허용 모델: {sorted(allowed)}"
+            )
+    
+    @staticmethod
+    def _messages(prompt: Prompt, system_prompt: Optional[str], model: str) -> List[Dict[str, Any]]:
+        """채팅 메시지 구성 (메시지 목록이면 모델 공급자 형식으로 변환, system_prompt는 무시)"""
+        if not isinstance(prompt, str):
+            return adapt_messages(prompt, model)
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    @staticmethod
+    def _log_success(label: str, model: str, usage: Any) -> None:
+        """호출 성공 로깅 (토큰 수는 API 응답의 usage 사용, 로그 비활성 시 포맷팅 생략)"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s 호출 성공: model=%s, input_tokens=%s, output_tokens=%s",
+                label,
+                model,
+                usage.prompt_tokens if usage else None,
+                usage.completion_tokens if usage else None
+            )
+    
+    def chat(
+        self,
+        prompt: Prompt,
+        temperature: float,
+        model: str,
+        max_tokens: Optional[int],
+        system_prompt: Optional[str]
+    ) -> str:
+        """동기 채팅 완성"""
+        self._check_model(model)
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=self._messages(prompt, system_prompt, model),
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            self._log_success("OpenRouter API", model, response.usage)
+            return response.choices[0].message.content or ""
+        
+        except Exception as e:
+            logger.error(f"OpenRouter API 호출 실패: {e}")
+            raise
+    
+    async def chat_async(
+        self,
+        prompt: Prompt,
+        temperature: float,
+        model: str,
+        max_tokens: Optional[int],
+        system_prompt: Optional[str],
+        stream: bool = False
+    ) -> str:
+        """비동기 채팅 완성"""
+        if stream:
+            return "".join([
+                delta async for delta in self.chat_stream(
+                    prompt, temperature, model, max_tokens, system_prompt
+                )
+            ])
+        
+        self._check_model(model)
+        
+        try:
+            # 동시 호출 수 제한 (공급자 429 및 재시도 폭주 방지)
+            async with self._get_semaphore():
+                response = await self.async_client.chat.completions.create(
+                    model=model,
+                    messages=self._messages(prompt, system_prompt, model),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            self._log_success("OpenRouter API 비동기", model, response.usage)
+            return response.choices[0].message.content or ""
+        
+        except Exception as e:
+            logger.error(f"OpenRouter API 비동기 호출 실패: {e}")
+            raise
+    
+    async def chat_stream(
+        self,
+        prompt: Prompt,
+        temperature: float,
+        model: str,
+        max_tokens: Optional[int],
+        system_prompt: Optional[str]
+    ) -> AsyncIterator[str]:
+        """스트리밍 채팅 완성 (응답 텍스트 조각을 수신 즉시 반환)"""
+        self._check_model(model)
+        
+        try:
+            async with self._get_semaphore():
+                response = await self.async_client.chat.completions.create(
+                    model=model,
+                    messages=self._messages(prompt, system_prompt, model),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                
+                usage = None
+                async with response:
+                    async for chunk in response:
+                        if chunk.usage is not None:
+                            usage = chunk.usage
+                        if chunk.choices:
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                yield delta
+            
+            self._log_success("OpenRouter API 스트리밍", model, usage)
+            
+        except Exception as e:
+            logger.error(f"OpenRouter API 스트리밍 호출 실패: {e}")
+            raise
+    
+    async def aclose(self) -> None:
+        """클라이언트 연결 종료 (애플리케이션 종료 시 호출)"""
+        self.client.close()
+        await self.async_client.close()
+
+
+@lru_cache(maxsize=1)
+def get_llm_client() -> _LLMClient:
+    """
+    전역 LLM 클라이언트 반환
+    
+    import 시점이 아닌 첫 호출 시 SDK 클라이언트를 생성합니다.
+    """
+    return _LLMClient()
+
+
+def get_openrouter_client() -> OpenAI:
+    """동기 OpenRouter SDK 클라이언트 반환"""
+    return get_llm_client().client
+
+
+async def aclose_llm_client() -> None:
+    """생성된 LLM 클라이언트가 있으면 종료 (애플리케이션 종료 시 호출)"""
+    if get_llm_client.cache_info().currsize:
+        await get_llm_client().aclose()
+        get_llm_client.cache_clear()
+
+
+def __getattr__(name: str) -> Any:
+    """기존 모듈 속성(llm_client, openrouter_client) 접근 시 클라이언트 지연 생성 (PEP 562)"""
+    if name == "llm_client":
+        return get_llm_client()
+    if name == "openrouter_client":
+        return get_openrouter_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def openrouter_chat(
-    prompt: str, 
-    temperature: float = 0.0, 
+    prompt: Prompt,
+    temperature: float = 0.0,
     model: str = settings.OPENROUTER_MODEL,
     max_tokens: Optional[int] = None,
     system_prompt: Optional[str] = None
@@ -30,7 +254,7 @@ def openrouter_chat(
     OpenRouter 채팅 완성 함수
     
     Args:
-        prompt: 사용자 프롬프트
+        prompt: 사용자 프롬프트 (또는 프롬프트 빌더가 만든 메시지 목록)
         temperature: 창의성 정도 (0.0-1.0)
         model: 사용할 모델
         max_tokens: 최대 토큰 수
@@ -43,58 +267,41 @@ def openrouter_chat(
         ValueError: 허용되지 않은 모델 사용 시
         Exception: API 호출 실패 시
     """
-    # 모델 검증
-    if model not in settings.ALLOWED_MODELS:
-        raise ValueError(
-            f"모델 '{model}'은 허용되지 않습니다. "
-            f"허용 모델: {settings.ALLOWED_MODELS}"
-        )
-    
-    try:
-        # 메시지 구성
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        # API 호출
-        response = openrouter_client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        
-        content = response.choices[0].message.content or ""
-        
-        # 로깅
-        logger.info(
-            f"OpenRouter API 호출 성공: model={model}, "
-            f"input_tokens={len(prompt)//4}, output_tokens={len(content)//4}"
-        )
-        
-        return content
-        
-    except Exception as e:
-        logger.error(f"OpenRouter API 호출 실패: {e}")
-        raise
+    return get_llm_client().chat(prompt, temperature, model, max_tokens, system_prompt)
 
 
 async def openrouter_chat_async(
-    prompt: str, 
-    temperature: float = 0.0, 
+    prompt: Prompt,
+    temperature: float = 0.0,
     model: str = settings.OPENROUTER_MODEL,
     max_tokens: Optional[int] = None,
-    system_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None,
+    stream: bool = False
 ) -> str:
     """
     OpenRouter 비동기 채팅 완성 함수
+    
+    AsyncOpenAI로 직접 호출하므로 스레드를 점유하지 않고,
+    동시 요청은 공유 연결 풀에서 함께 처리됩니다.
+    stream=True이면 스트리밍으로 수신한 응답을 합쳐 반환합니다.
     """
-    import asyncio
-    return await asyncio.get_event_loop().run_in_executor(
-        None, 
-        lambda: openrouter_chat(prompt, temperature, model, max_tokens, system_prompt)
-    )
+    return await get_llm_client().chat_async(prompt, temperature, model, max_tokens, system_prompt, stream)
+
+
+def openrouter_chat_stream(
+    prompt: Prompt,
+    temperature: float = 0.0,
+    model: str = settings.OPENROUTER_MODEL,
+    max_tokens: Optional[int] = None,
+    system_prompt: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    OpenRouter 스트리밍 채팅 완성 함수
+    
+    응답 텍스트 조각을 수신 즉시 반환하므로 호출 측에서 생성 도중 검증/중단할 수 있습니다.
+    중간에 중단할 경우 contextlib.aclosing으로 감싸 연결을 즉시 정리하세요.
+    """
+    return get_llm_client().chat_stream(prompt, temperature, model, max_tokens, system_prompt)
 
 
 def validate_model(model: str) -> bool:
@@ -103,7 +310,7 @@ def validate_model(model: str) -> bool:
     
     Args:
         model: 검증할 모델명
-        
+    
     Returns:
         유효한 모델인지 여부
     """
@@ -117,10 +324,4 @@ def get_available_models() -> list[str]:
     Returns:
         허용된 모델 목록
     """
-    return list(settings.ALLOWED_MODELS)
-
-
-# 호환성을 위한 별명들
-gpt5_chat = openrouter_chat
-gpt5_chat_async = openrouter_chat_async
-openai_client = openrouter_client
\ No newline at end of file
+    return sorted(settings.ALLOWED_MODELS)
@@ -0,0 +1,120 @@
+"""
+LLM 응답 유사도 캐시
+
+보험약관은 문서 간 상용구가 많아 같은 위치의 페이지 윈도우 내용이 거의 동일한 경우가 많습니다.
+윈도우 본문을 문자 n-gram 해시 벡터로 임베딩하고, 코사인 유사도가 임계값 이상인
+이전 항목이 있으면 그 응답을 재사용합니다.
+"""
+import logging
+import math
+import threading
+import zlib
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Hashable, Optional, Tuple
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# 임베딩 차원 (n-gram 해시 버킷 수)
+EMBEDDING_DIM = 4096
+NGRAM_SIZE = 3
+
+SparseVector = Dict[int, float]
+
+
+def embed_text(text: str) -> SparseVector:
+    """
+    문자 n-gram 해시 임베딩
+    
+    공백을 정규화한 뒤 n-gram 빈도를 해시 버킷에 누적하고 L2 정규화합니다.
+    정규화된 벡터의 내적이 곧 코사인 유사도입니다.
+    """
+    normalized = " ".join(text.split())
+    counts: Dict[int, float] = {}
+    for i in range(len(normalized) - NGRAM_SIZE + 1):
+        bucket = zlib.crc32(normalized[i:i + NGRAM_SIZE].encode("utf-8")) % EMBEDDING_DIM
+        counts[bucket] = counts.get(bucket, 0.0) + 1.0
+    
+    norm = math.sqrt(sum(v * v for v in counts.values()))
+    if norm == 0:
+        return {}
+    return {k: v / norm for k, v in counts.items()}
+
+
+def _dot(a: SparseVector, b: SparseVector) -> float:
+    """희소 벡터 내적 (작은 벡터 기준 순회)"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+
+class SemanticCache:
+    """
+    네임스페이스별 유사도 캐시
+    
+    네임스페이스(예: 윈도우 페이지 범위)가 같은 항목끼리만 비교하므로,
+    위치에 의존하는 응답(페이지 인덱스 등)이 다른 윈도우에 재사용되지 않습니다.
+    """
+    
+    def __init__(self, threshold: float, max_entries: int = 256, max_namespaces: int = 1024):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_namespaces = max_namespaces
+        self._entries: "OrderedDict[Hashable, Deque[Tuple[SparseVector, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.semantic_hits = 0
+        self.semantic_misses = 0
+    
+    def lookup(self, namespace: Hashable, text: str) -> Optional[str]:
+        """유사도가 임계값 이상인 가장 가까운 항목의 응답 반환 (없으면 None)"""
+        vector = embed_text(text)
+        if not vector:
+            return None
+        
+        with self._lock:
+            entries = list(self._entries.get(namespace, ()))
+        
+        best_score, best_value = 0.0, None
+        for cached_vector, value in entries:
+            score = _dot(vector, cached_vector)
+            if score > best_score:
+                best_score, best_value = score, value
+        
+        if best_value is not None and best_score >= self.threshold:
+            self.semantic_hits += 1
+            logger.info(f"유사도 캐시 적중: {namespace}, 유사도={best_score:.3f} (hits={self.semantic_hits})")
+            return best_value
+        
+        self.semantic_misses += 1
+        return None
+    
+    def add(self, namespace: Hashable, text: str, value: str) -> None:
+        """항목 추가 (네임스페이스별 최대 개수 초과 시 오래된 항목부터 제거)"""
+        vector = embed_text(text)
+        if not vector:
+            return
+        
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if entries is None:
+                entries = self._entries[namespace] = deque(maxlen=self.max_entries)
+                if len(self._entries) > self.max_namespaces:
+                    self._entries.popitem(last=False)
+            entries.append((vector, value))
+    
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """적중/미스 통계"""
+        return {"semantic_hits": self.semantic_hits, "semantic_misses": self.semantic_misses}
+
+
+# 전역 유사도 캐시 인스턴스 (SEMANTIC_CACHE_ENABLED일 때만 사용)
+semantic_cache = SemanticCache(settings.SEMANTIC_CACHE_THRESHOLD)
+
+# 섹션 본문 분석용 유사도 캐시 (섹션 간 비교이므로 네임스페이스 하나에 더 많은 항목 보관)
+content_semantic_cache = SemanticCache(settings.CONTENT_SEMANTIC_CACHE_THRESHOLD, max_entries=1024)
@@ -2,21 +2,18 @@
 LangGraph 기반 PDF 파싱 그래프 구성
 """
 import logging
-from typing import Dict, Any, AsyncGenerator
+import sqlite3
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, AsyncGenerator, Optional, Union
+from uuid import uuid4
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph
 
-# 선택적 체크포인터 import
-try:
-    from langgraph.checkpoint.sqlite import SqliteSaver
-    CHECKPOINT_AVAILABLE = True
-except ImportError:
-    SqliteSaver = None
-    CHECKPOINT_AVAILABLE = False
-
 from ..models.state import ParserState, JobStatus, create_initial_state
 from .nodes import (
     node_doc_info,
-    node_detect_toc_window,
+    node_detect_toc_all,
     node_extract_spans,
     node_llm_parse_toc,
     node_calc_page_end,
@@ -27,6 +24,48 @@ from .nodes import (
 
 logger = logging.getLogger(__name__)
 
+# 체크포인터 모드: 없음 | 프로세스 내 메모리 (반복 실행용) | SQLite 파일 (영속 저장)
+CHECKPOINTER_MODES = ("none", "memory", "sqlite")
+
+
+def _checkpointer_mode(checkpointer: Union[bool, str]) -> str:
+    """
+    체크포인터 설정값 정규화
+    
+    기존 bool 설정은 True → "sqlite", False → "none"으로 취급합니다.
+    """
+    if isinstance(checkpointer, bool):
+        return "sqlite" if checkpointer else "none"
+    if checkpointer not in CHECKPOINTER_MODES:
+        raise ValueError(f"지원하지 않는 체크포인터: {checkpointer} (허용: {CHECKPOINTER_MODES})")
+    return checkpointer
+
+
+def _create_checkpointer(mode: str) -> Optional[Any]:
+    """모드별 체크포인터 생성 (SqliteSaver는 사용할 때만 import)"""
+    if mode == "memory":
+        logger.info("메모리 체크포인터 활성화")
+        return MemorySaver()
+    
+    if mode == "sqlite":
+        try:
+            from langgraph.checkpoint.sqlite import SqliteSaver
+        except ImportError:
+            logger.warning("체크포인터를 요청했지만 langgraph.checkpoint.sqlite를 사용할 수 없습니다")
+            return None
+        
+        try:
+            # SQLite 체크포인터로 중간 상태 저장 (WAL + synchronous=NORMAL로 쓰기 fsync 최소화)
+            conn = sqlite3.connect("checkpoints.db", check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            logger.info("SQLite 체크포인터 활성화")
+            return SqliteSaver(conn)
+        except Exception as e:
+            logger.warning(f"체크포인터 설정 실패 (무시): {e}")
+    
+    return None
+
 
 def cond_after_detect(state: ParserState) -> str:
     """
@@ -36,16 +75,13 @@ def cond_after_detect(state: ParserState) -> str:
         state: 현재 상태
         
     Returns:
-        다음 노드명 ("continue" | "next" | "no_toc")
+        다음 노드명 ("next" | "no_toc")
     """
-    total_pages = state.get("total_pages", 0)
-    current_cursor = state.get("window_start", 0)
+    # 탐지 중 에러 발생 시 실패 처리
+    if state.get("error"):
+        return "no_toc"
     
-    # 아직 더 탐지할 페이지가 있는가?
-    if current_cursor < total_pages:
-        return "continue"  # 목차 탐지 루프 계속
-    
-    # 탐지 완료 - 목차 페이지가 발견되었는가?
+    # 탐지 완료 (detect_toc는 모든 윈도우를 한 번에 탐지) - 목차 페이지가 발견되었는가?
     toc_pages = state.get("toc_pages", [])
     if toc_pages:
         return "next"      # 스팬 추출로 진행
@@ -73,16 +109,25 @@ def cond_after_parse(state: ParserState) -> str:
         return "fail"      # 파싱 실패
 
 
-def create_parser_graph(use_checkpointer: bool = False) -> StateGraph:
+def create_parser_graph(checkpointer: Union[bool, str] = "none") -> StateGraph:
     """
     PDF 파싱 그래프 생성
     
+    그래프 구성은 문서와 무관하므로 체크포인터 모드별로
+    한 번만 컴파일하고 이후 호출에서는 캐시된 그래프를 재사용합니다.
+    
     Args:
-        use_checkpointer: SQLite 체크포인터 사용 여부
+        checkpointer: 체크포인터 모드 ("none" | "memory" | "sqlite", bool은 하위 호환)
         
     Returns:
         컴파일된 LangGraph
     """
+    return _compile_parser_graph(_checkpointer_mode(checkpointer))
+
+
+@lru_cache(maxsize=len(CHECKPOINTER_MODES))
+def _compile_parser_graph(mode: str) -> StateGraph:
+    """체크포인터 모드별 그래프 구성 및 컴파일"""
     logger.info("PDF 파싱 그래프 생성 시작")
     
     # StateGraph 초기화
@@ -90,7 +135,7 @@ def create_parser_graph(use_checkpointer: bool = False) -> StateGraph:
     
     # 노드 추가
     graph.add_node("doc_info", node_doc_info)
-    graph.add_node("detect_toc", node_detect_toc_window)
+    graph.add_node("detect_toc", node_detect_toc_all)
     graph.add_node("extract_spans", node_extract_spans)
     graph.add_node("llm_toc", node_llm_parse_toc)
     graph.add_node("calc_end", node_calc_page_end)
@@ -104,9 +149,8 @@ def create_parser_graph(use_checkpointer: bool = False) -> StateGraph:
     # 엣지 연결
     graph.add_edge("doc_info", "detect_toc")
     
-    # 조건부 분기: 목차 탐지 루프
+    # 조건부 분기: 목차 탐지 결과
     graph.add_conditional_edges("detect_toc", cond_after_detect, {
-        "continue": "detect_toc",      # 다음 윈도우 계속 탐지
         "next": "extract_spans",       # 탐지 완료 → 스팬 추출
         "no_toc": "fail",             # 목차 없음 → 실패
     })
@@ -129,16 +173,7 @@ def create_parser_graph(use_checkpointer: bool = False) -> StateGraph:
     graph.add_edge("fail", "__end__")
     
     # 체크포인터 설정 (선택사항)
-    checkpointer = None
-    if use_checkpointer and CHECKPOINT_AVAILABLE:
-        try:
-            # SQLite 체크포인터로 중간 상태 저장
-            checkpointer = SqliteSaver.from_conn_string("checkpoints.db")
-            logger.info("SQLite 체크포인터 활성화")
-        except Exception as e:
-            logger.warning(f"체크포인터 설정 실패 (무시): {e}")
-    elif use_checkpointer and not CHECKPOINT_AVAILABLE:
-        logger.warning("체크포인터를 요청했지만 langgraph.checkpoint.sqlite를 사용할 수 없습니다")
+    checkpointer = _create_checkpointer(mode)
     
     # 그래프 컴파일
     app = graph.compile(checkpointer=checkpointer)
@@ -147,6 +182,19 @@ def create_parser_graph(use_checkpointer: bool = False) -> StateGraph:
     return app
 
 
+def _run_config(app: Any, doc_id: str) -> Optional[Dict[str, Any]]:
+    """
+    체크포인터 실행 설정 (체크포인터가 없으면 None)
+    
+    같은 thread_id로 다시 실행하면 LangGraph가 이전 체크포인트에 새 입력을 병합하므로,
+    초기 상태에 없는 키(error, sections 등)가 이전 실행에서 넘어옵니다.
+    실행마다 고유한 스레드를 사용하고, 문서 ID는 접두사로 남겨 조회할 수 있게 합니다.
+    """
+    if not app.checkpointer:
+        return None
+    return {"configurable": {"thread_id": f"{doc_id}:{uuid4().hex}"}}
+
+
 async def run_parsing_flow(doc_id: str, **kwargs) -> ParserState:
     """
     PDF 파싱 플로우 실행
@@ -165,16 +213,18 @@ async def run_parsing_flow(doc_id: str, **kwargs) -> ParserState:
         window_size = kwargs.get("window_size", 5)
         initial_state = create_initial_state(doc_id, window_size)
         
-        # 그래프 생성
-        use_checkpointer = kwargs.get("use_checkpointer", False)
-        app = create_parser_graph(use_checkpointer)
+        # 그래프 생성 (checkpointer 또는 기존 use_checkpointer 설정)
+        checkpointer = kwargs.get("checkpointer", kwargs.get("use_checkpointer", False))
+        app = create_parser_graph(checkpointer)
+        
+        # 체크포인터 사용 시 실행별 스레드로 상태 저장
+        config = _run_config(app, doc_id)
         
         # 플로우 실행
-        final_state = await app.ainvoke(initial_state)
+        final_state = await app.ainvoke(initial_state, config)
         
         # 실행 시간 계산
         if "created_at" in final_state and "updated_at" in final_state:
-            from datetime import datetime
             try:
                 start = datetime.fromisoformat(final_state["created_at"])
                 end = datetime.fromisoformat(final_state["updated_at"])
@@ -213,12 +263,15 @@ async def run_parsing_flow_with_stream(doc_id: str, **kwargs) -> AsyncGenerator[
         window_size = kwargs.get("window_size", 5)
         initial_state = create_initial_state(doc_id, window_size)
         
-        # 그래프 생성
-        use_checkpointer = kwargs.get("use_checkpointer", False)
-        app = create_parser_graph(use_checkpointer)
+        # 그래프 생성 (checkpointer 또는 기존 use_checkpointer 설정)
+        checkpointer = kwargs.get("checkpointer", kwargs.get("use_checkpointer", False))
+        app = create_parser_graph(checkpointer)
+        
+        # 체크포인터 사용 시 실행별 스레드로 상태 저장
+        config = _run_config(app, doc_id)
         
         # 스트리밍 실행
-        async for state in app.astream(initial_state):
+        async for state in app.astream(initial_state, config):
             yield state
             
     except Exception as e:
@@ -240,7 +293,7 @@ def get_graph_visualization() -> str:
     return """
     PDF 파싱 파이프라인 그래프:
     
-    START → doc_info → detect_toc ⟲ (윈도우 탐지 루프)
+    START → doc_info → detect_toc (전체 윈도우 동시 탐지)
                               ↓
                       extract_spans → llm_toc → calc_end → extract_ranges → write_csv → END
                               ↓                    ↓
@@ -249,7 +302,7 @@ def get_graph_visualization() -> str:
                             END
     
     조건부 분기:
-    1. detect_toc 후: continue(루프) | next(진행) | no_toc(실패)
+    1. detect_toc 후: next(진행) | no_toc(실패)
     2. llm_toc 후: success(진행) | fail(실패)
     """
 
@@ -257,7 +310,7 @@ def get_graph_visualization() -> str:
 class ParsingGraphManager:
     """PDF 파싱 그래프 매니저"""
     
-    def __init__(self, use_checkpointer: bool = False):
+    def __init__(self, use_checkpointer: Union[bool, str] = False):
         self.use_checkpointer = use_checkpointer
         self._graph = None
     
@@ -280,11 +333,14 @@ class ParsingGraphManager:
     def get_status(self) -> Dict[str, Any]:
         """매니저 상태 반환"""
         return {
-            "checkpointer_enabled": self.use_checkpointer,
+            "checkpointer_enabled": _checkpointer_mode(self.use_checkpointer) != "none",
             "graph_initialized": self._graph is not None,
             "graph_visualization": get_graph_visualization()
         }
 
 
+# 기본 그래프 미리 컴파일 (첫 요청의 컴파일 지연 제거)
+create_parser_graph("none")
+
 # 전역 매니저 인스턴스
 default_manager = ParsingGraphManager()
\ No newline at end of file
@@ -1,23 +1,51 @@
 """
 LangGraph 노드 구현
 """
-import json
+import asyncio
 import os
+import re
 import csv
+import difflib
 import logging
-from typing import Dict, Any, List
+from contextlib import aclosing
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+import orjson
+
 from ..models.state import ParserState, JobStatus, update_state_status, add_log, set_error
-from ..clients.mcp_client import pdf_get_info, pdf_parse_layout_spans, pdf_read
-from ..clients.openrouter_client import openrouter_chat as gpt5_chat
+from ..clients.mcp_client import pdf_get_info, pdf_parse_layout_spans, pdf_read, pdf_read_pages
+from ..clients.openrouter_client import openrouter_chat_async, openrouter_chat_stream
+from ..clients.llm_cache import llm_cache, cache_key
+from ..clients.semantic_cache import semantic_cache, content_semantic_cache
 from ..prompts.insurance_prompts import (
     get_toc_detect_prompt,
+    get_toc_detect_prompt_batch,
     get_toc_parsing_prompt,
-    SYSTEM_PROMPT
+    get_content_analysis_prompt,
+    SYSTEM_PROMPT,
+    PROMPT_VERSION,
+    CONTENT_ANALYSIS_MAX_CHARS
 )
 from ..config import settings
 
+# 선택적 고속 fuzzy 매칭 (rapidfuzz 미설치 시 difflib 사용)
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    fuzz = None
+    RAPIDFUZZ_AVAILABLE = False
+
+# 선택적 대량 스팬 정렬 (numpy 미설치 시 sorted 사용)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,60 +78,280 @@ async def node_doc_info(state: ParserState) -> ParserState:
         return set_error(state, f"문서 정보 조회 실패: {str(e)}")
 
 
-async def node_detect_toc_window(state: ParserState) -> ParserState:
+async def _detect_window(doc_id: str, pages: List[int]) -> Dict[str, Any]:
     """
-    5페이지 윈도우 기반 목차 탐지 노드
+    윈도우 하나의 목차 페이지 탐지
     
-    현재 윈도우의 페이지들을 분석하여 목차 페이지를 탐지합니다.
-    """
-    try:
-        ws = state.get("window_size", settings.WINDOW_SIZE)
-        start = state.get("window_start", 0)
-        total = state["total_pages"]
-        end = min(start + ws, total)
-        pages = list(range(start, end))
-        
-        logger.info(f"목차 탐지 시작: 윈도우 {start}-{end-1} ({len(pages)}페이지)")
-        
-        # 프롬프트 생성
-        doc_info = {"doc_id": state["doc_id"]}
-        prompt = get_toc_detect_prompt(doc_info, pages)
+    Returns:
+        LLM 응답 JSON (toc_pages, confidence, reason)
         
-        # GPT-5로 목차 탐지
-        result_str = gpt5_chat(
+    Raises:
+        orjson.JSONDecodeError: 응답 파싱 실패 시
+    """
+    # 프롬프트 생성
+    doc_info = {"doc_id": doc_id}
+    prompt = get_toc_detect_prompt(doc_info, pages)
+    
+    # 캐시 조회 (temperature=0 호출은 결정적)
+    key = cache_key(prompt, None, 0.0, prompt_version=PROMPT_VERSION)
+    result_str = await llm_cache.aget(key) if key else None
+    cache_hit = result_str is not None
+    
+    # GPT-5로 목차 탐지 (비동기 호출, 동시 호출 수는 LLM 클라이언트에서 제한)
+    if not cache_hit:
+        result_str = await openrouter_chat_async(
             prompt=prompt,
-            system_prompt=SYSTEM_PROMPT,
             temperature=0.0
         )
+    
+    # JSON 파싱
+    result = orjson.loads(result_str)
+    
+    # 파싱에 성공한 응답만 캐시에 저장
+    if not cache_hit and key:
+        await llm_cache.aset(key, result_str)
+    
+    return result
+
+
+async def _detect_window_batch(doc_id: str, windows: List[List[int]]) -> List[Dict[str, Any]]:
+    """
+    여러 윈도우의 목차 페이지를 LLM 호출 하나로 탐지
+    
+    Returns:
+        윈도우 순서와 같은 순서의 결과 (응답에 없는 윈도우는 탐지 결과 없음으로 처리)
         
-        # JSON 파싱
-        try:
-            result = json.loads(result_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"목차 탐지 JSON 파싱 실패: {e}")
-            return set_error(state, f"목차 탐지 응답 파싱 실패: {str(e)}")
-        
-        # 탐지된 목차 페이지 병합
-        detected_pages = result.get("toc_pages", []) or []
-        confidence = result.get("confidence", 0.0)
-        reason = result.get("reason", "")
-        
-        # 기존 목차 페이지와 병합
-        existing_pages = state.get("toc_pages", [])
-        all_toc_pages = sorted(list(set(existing_pages + detected_pages)))
-        state["toc_pages"] = all_toc_pages
-        
-        # 다음 윈도우로 이동
-        state["window_start"] = end
+    Raises:
+        orjson.JSONDecodeError: 응답 파싱 실패 시
+    """
+    prompt = get_toc_detect_prompt_batch({"doc_id": doc_id}, windows)
+    
+    # 캐시 조회 (temperature=0 호출은 결정적)
+    key = cache_key(prompt, None, 0.0, prompt_version=PROMPT_VERSION)
+    result_str = await llm_cache.aget(key) if key else None
+    cache_hit = result_str is not None
+    
+    if not cache_hit:
+        result_str = await openrouter_chat_async(
+            prompt=prompt,
+            temperature=0.0
+        )
+    
+    # JSON 파싱 후 window_id로 매칭
+    data = orjson.loads(result_str)
+    by_window = {
+        item.get("window_id"): item
+        for item in data.get("results", []) or []
+        if isinstance(item, dict)
+    }
+    
+    # 파싱에 성공한 응답만 캐시에 저장
+    if not cache_hit and key:
+        await llm_cache.aset(key, result_str)
+    
+    results = []
+    for window_id, pages in enumerate(windows):
+        item = by_window.get(window_id)
+        if item is None:
+            logger.warning(f"목차 탐지 배치 응답에 윈도우 누락: {pages[0]}-{pages[-1]}")
+            item = {"toc_pages": [], "confidence": 0.0, "reason": ""}
+        results.append(item)
+    return results
+
+
+async def _detect_windows(doc_id: str, windows: List[List[int]]) -> List[Dict[str, Any]]:
+    """윈도우 묶음 탐지 (윈도우가 하나면 단일 윈도우 프롬프트 사용)"""
+    if len(windows) == 1:
+        return [await _detect_window(doc_id, windows[0])]
+    return await _detect_window_batch(doc_id, windows)
+
+
+async def _semantic_lookup_window(doc_id: str, pages: List[int]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    유사도 캐시 조회 (같은 페이지 범위에서 본문이 거의 같은 윈도우의 결과 재사용)
+    
+    Returns:
+        (캐시된 탐지 결과 또는 None, 캐시 저장에 쓸 윈도우 본문 또는 None)
+    """
+    try:
+        window_text = (await pdf_read(doc_id, pages, mode="plain")).get("plain", "")
+        result_str = await asyncio.to_thread(semantic_cache.lookup, tuple(pages), window_text)
+    except Exception as e:
+        logger.warning(f"유사도 캐시 조회 실패 (무시): {e}")
+        return None, None
+    
+    if result_str is None:
+        return None, window_text
+    return orjson.loads(result_str), window_text
+
+
+# 규칙 기반 목차 판별 패턴
+TOC_HEADING_PATTERN = re.compile(r"제\s*\d+\s*(?:관|장|조)")
+TOC_LEADER_PATTERN = re.compile(r"(?:\.{5,}|·{5,}|…{2,})\s*\d+")
+TOC_PAGE_NUMBER_PATTERN = re.compile(r"(?:^|\s)\d{1,4}\s*$")
+TOC_TITLE_KEYWORDS = ("목차", "목 차", "차례")
+
+
+def cheap_toc_score(page_text: str) -> float:
+    """
+    페이지 텍스트의 규칙 기반 목차 점수 (0.0-1.0)
+    
+    점선 리더 줄 수, 페이지 번호로 끝나는 줄 비율, 관/장/조 번호 수와
+    상단의 목차 제목 여부로 점수를 매깁니다.
+    """
+    lines = [line for line in page_text.splitlines() if line.strip()]
+    if not lines:
+        return 0.0
+    
+    leaders = len(TOC_LEADER_PATTERN.findall(page_text))
+    headings = len(TOC_HEADING_PATTERN.findall(page_text))
+    numbered = sum(1 for line in lines if TOC_PAGE_NUMBER_PATTERN.search(line))
+    
+    score = 0.4 * min(leaders / 5, 1.0) + 0.3 * numbered / len(lines) + 0.2 * min(headings / 10, 1.0)
+    if any(keyword in line for line in lines[:3] for keyword in TOC_TITLE_KEYWORDS):
+        score += 0.3
+    return min(score, 1.0)
+
+
+async def _cheap_detect_windows(doc_id: str, windows: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    규칙 기반 1차 목차 판별 (LLM 캐스케이드의 저비용 단계)
+    
+    윈도우의 모든 페이지가 TOC_CASCADE_HIGH 이상이거나 TOC_CASCADE_LOW 미만이면
+    LLM 없이 결과를 확정합니다. 점수가 애매한 페이지가 있거나 본문을 읽지 못한 윈도우는 제외합니다.
+    
+    Returns:
+        {윈도우: 탐지 결과} (판별이 확실한 윈도우만)
+    """
+    page_results = await pdf_read_pages(
+        doc_id, [page for start, end in windows for page in range(start, end)], mode="plain"
+    )
+    
+    decided = {}
+    for start, end in windows:
+        results = [page_results.get(page) for page in range(start, end)]
+        if not all(isinstance(result, dict) for result in results):
+            continue
+        
+        scores = {
+            page: cheap_toc_score(result.get("plain", ""))
+            for page, result in zip(range(start, end), results)
+        }
+        if any(settings.TOC_CASCADE_LOW <= score < settings.TOC_CASCADE_HIGH for score in scores.values()):
+            continue
+        
+        toc_pages = [page for page, score in scores.items() if score >= settings.TOC_CASCADE_HIGH]
+        if toc_pages:
+            decided[(start, end)] = {
+                "toc_pages": toc_pages,
+                "confidence": min(scores[page] for page in toc_pages),
+                "reason": f"규칙 기반 판별 (점선 리더/페이지 번호/조항 번호 패턴): {toc_pages}"
+            }
+        else:
+            decided[(start, end)] = {"toc_pages": [], "confidence": 1.0 - max(scores.values()), "reason": ""}
+    return decided
+
+
+def _merge_window_result(state: ParserState, start: int, end: int, result: Dict[str, Any]) -> ParserState:
+    """윈도우 탐지 결과를 기존 목차 페이지와 병합하고 로그 기록"""
+    detected_pages = result.get("toc_pages", []) or []
+    confidence = result.get("confidence", 0.0)
+    reason = result.get("reason", "")
+    
+    # 기존 목차 페이지와 병합
+    existing_pages = state.get("toc_pages", [])
+    state["toc_pages"] = sorted(list(set(existing_pages + detected_pages)))
+    
+    # 로그 기록
+    log_msg = f"윈도우 {start}-{end-1} 탐지 완료: 발견={detected_pages}, 신뢰도={confidence:.2f}"
+    state = add_log(state, log_msg)
+    
+    if detected_pages:
+        state = add_log(state, f"탐지 근거: {reason}")
+    
+    return state
+
+
+async def node_detect_toc_all(state: ParserState) -> ParserState:
+    """
+    전체 윈도우 동시 목차 탐지 노드
+    
+    남은 페이지를 윈도우로 나눠 한 번에 동시 탐지하므로,
+    전체 소요 시간이 윈도우별 LLM 호출 시간의 합이 아니라 가장 느린 호출 수준이 됩니다.
+    """
+    try:
+        ws = state.get("window_size", settings.WINDOW_SIZE)
+        total = state["total_pages"]
+        windows = [(start, min(start + ws, total)) for start in range(state.get("window_start", 0), total, ws)]
         
-        # 로그 기록
-        log_msg = f"윈도우 {start}-{end-1} 탐지 완료: 발견={detected_pages}, 신뢰도={confidence:.2f}"
-        state = add_log(state, log_msg)
+        # 규칙 기반 판별이 확실한 윈도우는 LLM 호출 생략
+        window_results: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        if settings.TOC_CASCADE_ENABLED:
+            try:
+                window_results = await _cheap_detect_windows(state["doc_id"], windows)
+            except Exception as e:
+                logger.warning(f"규칙 기반 목차 판별 실패 (전체 LLM 탐지): {e}")
+        pending = [window for window in windows if window not in window_results]
+        
+        # 유사도 캐시에 있는 윈도우는 LLM 호출 생략 (배치로 묶기 전에 윈도우별로 조회)
+        window_texts: Dict[Tuple[int, int], str] = {}
+        semantic_hits = 0
+        if settings.SEMANTIC_CACHE_ENABLED and pending:
+            lookups = await asyncio.gather(
+                *(_semantic_lookup_window(state["doc_id"], list(range(start, end))) for start, end in pending)
+            )
+            for window, (result, window_text) in zip(pending, lookups):
+                if result is not None:
+                    window_results[window] = result
+                    semantic_hits += 1
+                elif window_text:
+                    window_texts[window] = window_text
+            pending = [window for window in pending if window not in window_results]
+        
+        # 윈도우를 TOC_DETECT_BATCH_WINDOWS개씩 묶어 LLM 호출 하나로 탐지 (지시문은 호출당 한 번만 전송)
+        batch_size = max(1, settings.TOC_DETECT_BATCH_WINDOWS)
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        
+        logger.info(
+            f"목차 동시 탐지 시작: {len(windows)}개 윈도우 "
+            f"(규칙 기반 판별 {len(window_results) - semantic_hits}개, 유사도 캐시 {semantic_hits}개), "
+            f"{len(batches)}회 호출"
+        )
         
-        if detected_pages:
-            state = add_log(state, f"탐지 근거: {reason}")
+        results = await asyncio.gather(
+            *(
+                _detect_windows(state["doc_id"], [list(range(start, end)) for start, end in batch])
+                for batch in batches
+            ),
+            return_exceptions=True
+        )
         
-        logger.info(f"목차 탐지 완료: 총 {len(all_toc_pages)}페이지 발견")
+        # 하나라도 실패하면 목차가 누락될 수 있으므로 실패 처리
+        for batch, batch_results in zip(batches, results):
+            start, end = batch[0][0], batch[-1][1]
+            if isinstance(batch_results, orjson.JSONDecodeError):
+                logger.error(f"목차 탐지 JSON 파싱 실패: 윈도우 {start}-{end-1}, {batch_results}")
+                return set_error(state, f"목차 탐지 응답 파싱 실패: {str(batch_results)}")
+            if isinstance(batch_results, Exception):
+                raise batch_results
+            window_results.update(zip(batch, batch_results))
+            
+            # 유사도 캐시에 윈도우별 결과 저장 (배치 응답의 window_id는 제외)
+            for (window_start, window_end), result in zip(batch, batch_results):
+                window_text = window_texts.get((window_start, window_end))
+                if window_text:
+                    result_str = orjson.dumps({k: v for k, v in result.items() if k != "window_id"}).decode()
+                    await asyncio.to_thread(
+                        semantic_cache.add, tuple(range(window_start, window_end)), window_text, result_str
+                    )
+        
+        # 윈도우 순서대로 결과 병합
+        for window_start, window_end in windows:
+            state = _merge_window_result(state, window_start, window_end, window_results[(window_start, window_end)])
+        
+        state["window_start"] = total
+        
+        logger.info(f"목차 탐지 완료: 총 {len(state.get('toc_pages', []))}페이지 발견")
         return state
         
     except Exception as e:
@@ -149,6 +397,125 @@ async def node_extract_spans(state: ParserState) -> ParserState:
         return set_error(state, f"스팬 추출 실패: {str(e)}")
 
 
+# numpy 정렬을 사용할 최소 스팬 수 (작은 입력은 배열 변환 비용이 더 큼)
+NUMPY_SORT_MIN_SPANS = 10000
+
+
+def _sort_spans(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    스팬을 (page, line_id, span_id) 순으로 정렬
+    
+    스팬이 많으면 정렬 키를 numpy 배열로 만들어 np.lexsort(안정 정렬)로 순서를 구하므로
+    sorted와 결과가 같으면서 Python 수준 튜플 비교를 피합니다.
+    """
+    if not NUMPY_AVAILABLE or len(spans) < NUMPY_SORT_MIN_SPANS:
+        return sorted(spans, key=lambda s: (
+            s.get("page", 0), 
+            s.get("line_id", 0), 
+            s.get("span_id", 0)
+        ))
+    
+    keys = np.fromiter(
+        ((s.get("page", 0), s.get("line_id", 0), s.get("span_id", 0)) for s in spans),
+        dtype=[("page", "i8"), ("line_id", "i8"), ("span_id", "i8")],
+        count=len(spans)
+    )
+    order = np.lexsort((keys["span_id"], keys["line_id"], keys["page"]))
+    return [spans[i] for i in order.tolist()]
+
+
+# 섹션 본문 분석 유사도 캐시 네임스페이스 (비교 본문 길이는 프롬프트의 문자 수 기준 최대 길이 사용)
+CONTENT_ANALYSIS_NAMESPACE = "content_analysis"
+
+
+async def analyze_section_content(title: str, content: str) -> Dict[str, Any]:
+    """
+    섹션 본문 LLM 분석
+    
+    정확 일치 캐시를 먼저 조회하고, SEMANTIC_CACHE_ENABLED이면
+    제목+본문 앞부분이 거의 같은 (상용구가 반복되는) 섹션의 이전 분석 결과를 재사용합니다.
+    유사도 캐시는 항목 수에 비례해 순회하므로 조회/저장은 스레드에서 실행합니다.
+    
+    Raises:
+        orjson.JSONDecodeError: 응답 파싱 실패 시
+    """
+    prompt = get_content_analysis_prompt(content, title)
+    
+    # 캐시 조회 (temperature=0 호출은 결정적)
+    key = cache_key(prompt, SYSTEM_PROMPT, 0.0, prompt_version=PROMPT_VERSION)
+    result_str = await llm_cache.aget(key) if key else None
+    cache_hit = result_str is not None
+    
+    # 유사도 캐시 조회
+    similarity_text = f"{title}\n{content[:CONTENT_ANALYSIS_MAX_CHARS]}"
+    if not cache_hit and settings.SEMANTIC_CACHE_ENABLED:
+        result_str = await asyncio.to_thread(content_semantic_cache.lookup, CONTENT_ANALYSIS_NAMESPACE, similarity_text)
+        cache_hit = result_str is not None
+    
+    if not cache_hit:
+        result_str = await openrouter_chat_async(
+            prompt=prompt,
+            system_prompt=SYSTEM_PROMPT,
+            temperature=0.0
+        )
+    
+    result = orjson.loads(result_str)
+    
+    # 파싱에 성공한 응답만 캐시에 저장
+    if not cache_hit:
+        if key:
+            await llm_cache.aset(key, result_str)
+        if settings.SEMANTIC_CACHE_ENABLED:
+            await asyncio.to_thread(content_semantic_cache.add, CONTENT_ANALYSIS_NAMESPACE, similarity_text, result_str)
+    
+    return result
+
+
+def _format_span(span: Dict[str, Any]) -> str:
+    """스팬 하나를 LLM 입력용 텍스트 블록으로 변환 (2자 미만 텍스트는 빈 문자열)"""
+    text = (span.get("text") or "").strip()
+    if len(text) < 2:
+        return ""
+    
+    bold = "_Bold" if span.get("bold", False) else ""
+    return (
+        f"페이지 {span.get('page', 0) + 1}, 라인 {span.get('line_id', 0) + 1}: {text} "
+        f"[{span.get('font_name', 'Unknown')}, {span.get('font_size', 0)}pt{bold}]"
+    )
+
+
+# 페이지 번호 없이 점선 리더만 있는 장식 스팬 (예: "..........."),
+# "........ 15"처럼 페이지 번호가 붙은 리더는 목차 항목의 페이지 정보이므로 제외
+DOT_LEADER_PATTERN = re.compile(r"[.·…‥\s]+")
+
+
+def _toc_blocks(spans_sorted: List[Dict[str, Any]]) -> List[str]:
+    """
+    정렬된 스팬을 LLM 입력용 텍스트 블록 목록으로 변환
+    
+    겹치는 텍스트 런에서 같은 페이지의 같은 텍스트가 연달아 나오는 중복 스팬과
+    페이지 번호 없는 연속된 점선 리더 스팬은 하나만 남깁니다. 떨어져 있는 같은 제목(특약별 "제1조" 등)은 유지합니다.
+    """
+    blocks = []
+    prev_key = None
+    prev_leader = False
+    for span in spans_sorted:
+        block = _format_span(span)
+        if not block:
+            continue
+        
+        text = span["text"].strip()
+        key = (span.get("page", 0), text)
+        leader = DOT_LEADER_PATTERN.fullmatch(text) is not None
+        if key == prev_key or (leader and prev_leader):
+            continue
+        
+        blocks.append(block)
+        prev_key = key
+        prev_leader = leader
+    return blocks
+
+
 async def node_llm_parse_toc(state: ParserState) -> ParserState:
     """
     LLM 목차 파싱 노드
@@ -164,48 +531,56 @@ async def node_llm_parse_toc(state: ParserState) -> ParserState:
         logger.info(f"목차 파싱 시작: {len(spans)}개 스팬")
         
         # 스팬 데이터 정렬 및 정제
-        spans_sorted = sorted(spans, key=lambda s: (
-            s.get("page", 0), 
-            s.get("line_id", 0), 
-            s.get("span_id", 0)
-        ))
+        spans_sorted = _sort_spans(spans)
         
-        # 스팬을 텍스트 블록으로 변환
-        blocks = []
-        for span in spans_sorted:
-            text = (span.get("text") or "").strip()
-            if not text or len(text) < 2:
-                continue
-                
-            font_name = span.get("font_name", "Unknown")
-            font_size = span.get("font_size", 0)
-            bold = span.get("bold", False)
-            page = span.get("page", 0)
-            line_id = span.get("line_id", 0)
-            
-            block = f"페이지 {page+1}, 라인 {line_id+1}: {text} [{font_name}, {font_size}pt{'_Bold' if bold else ''}]"
-            blocks.append(block)
+        # 스팬을 텍스트 블록 문자열로 변환 (짧은 텍스트와 중복 스팬은 제외)
+        blocks = _toc_blocks(spans_sorted)
+        if len(blocks) < len(spans_sorted):
+            logger.info(f"목차 파싱 입력 블록: {len(blocks)}개 (스팬 {len(spans_sorted)}개 중 짧은/중복 스팬 제외)")
+        blocks_str = "\n".join(blocks)
         
-        if not blocks:
+        if not blocks_str:
             return set_error(state, "유효한 텍스트 블록이 없음")
         
         # 목차 파싱 프롬프트 생성
-        prompt = get_toc_parsing_prompt(blocks)
-        
-        # GPT-5로 목차 파싱
-        result_str = gpt5_chat(
-            prompt=prompt,
-            system_prompt=SYSTEM_PROMPT,
-            temperature=0.0
-        )
+        prompt = get_toc_parsing_prompt(blocks_str)
+        
+        # 캐시 조회 (temperature=0 호출은 결정적)
+        key = cache_key(prompt, None, 0.0, prompt_version=PROMPT_VERSION)
+        result_str = await llm_cache.aget(key) if key else None
+        cache_hit = result_str is not None
+        
+        # GPT-5로 목차 파싱 (스트리밍 수신, JSON 객체로 시작하지 않으면 생성 도중 중단)
+        if not cache_hit:
+            parts = []
+            started = False
+            async with aclosing(openrouter_chat_stream(
+                prompt=prompt,
+                temperature=0.0
+            )) as deltas:
+                async for delta in deltas:
+                    parts.append(delta)
+                    if not started:
+                        head = "".join(parts).lstrip()
+                        if not head:
+                            continue
+                        if not head.startswith("{"):
+                            logger.error(f"목차 파싱 응답이 JSON 객체가 아님: {head[:50]!r}")
+                            return set_error(state, "목차 파싱 응답 파싱 실패: JSON 객체가 아닌 응답")
+                        started = True
+            result_str = "".join(parts)
         
         # JSON 파싱
         try:
-            result = json.loads(result_str)
-        except json.JSONDecodeError as e:
+            result = orjson.loads(result_str)
+        except orjson.JSONDecodeError as e:
             logger.error(f"목차 파싱 JSON 파싱 실패: {e}")
             return set_error(state, f"목차 파싱 응답 파싱 실패: {str(e)}")
         
+        # 파싱에 성공한 응답만 캐시에 저장
+        if key and not cache_hit:
+            await llm_cache.aset(key, result_str)
+        
         # 파싱 결과 검증
         status = result.get("status", 500)
         parsed_items = result.get("parsed", [])
@@ -274,6 +649,104 @@ async def node_calc_page_end(state: ParserState) -> ParserState:
         return set_error(state, f"page_end 계산 실패: {str(e)}")
 
 
+# 표/그림 포함 여부 판단 키워드 (str.__contains__는 C 구현 부분 문자열 탐색으로 정규식보다 빠름)
+TABLE_MARKERS = ("표", "Table")
+FIGURE_MARKERS = ("그림", "Figure", "도")
+
+
+def _section_pages(item: Dict[str, Any]) -> List[int]:
+    """섹션의 page_start~page_end 페이지 목록"""
+    start_page = int(item.get("page_start", 0))
+    end_page = int(item.get("page_end", start_page))
+    return list(range(start_page, end_page + 1)) if end_page >= start_page else [start_page]
+
+
+def _content_metrics(content: str) -> Dict[str, Any]:
+    """
+    본문 통계 (문단 수, 문자 수, 표/그림 포함 여부)
+    
+    strip은 한 번만 수행하고, 빈 본문은 나머지 탐색을 건너뜁니다.
+    각 탐색은 C 구현 str 메서드라 Python 루프로 한 번에 세는 것보다 빠릅니다.
+    """
+    stripped = content.strip()
+    if not stripped:
+        return {"para_count": 0, "char_count": 0, "has_table": False, "has_figure": False}
+    
+    return {
+        "para_count": content.count("\n\n") + 1,
+        "char_count": len(stripped),
+        "has_table": any(mark in stripped for mark in TABLE_MARKERS),
+        "has_figure": any(mark in stripped for mark in FIGURE_MARKERS),
+    }
+
+
+def _build_section(i: int, item: Dict[str, Any], pages: List[int], full_content: str) -> Dict[str, Any]:
+    """추출한 본문으로 섹션 메타데이터 생성"""
+    # 제목 우선순위: jo > kwan > level_3 > level_2 > level_1
+    title = (
+        item.get("jo") or 
+        item.get("kwan") or 
+        item.get("level_3") or 
+        item.get("level_2") or 
+        item.get("level_1") or 
+        f"섹션 {i}"
+    )
+    
+    # 제목 이후 본문 추출
+    pure_content = extract_content_after_title(full_content, title)
+    
+    # 메타데이터 생성
+    meta = {
+        "text": pure_content,
+        **_content_metrics(pure_content),
+        "pages": pages,
+        "title": title,
+        "section_id": i
+    }
+    
+    logger.debug(f"섹션 {i} 추출 완료: {len(pure_content)}자")
+    
+    # 원본 데이터와 메타데이터 병합
+    return {**item, **meta}
+
+
+def _failed_section(i: int, item: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+    """추출 실패 섹션 (기본 정보와 에러만 포함)"""
+    logger.error(f"섹션 {i} 추출 실패: {error}")
+    return {
+        **item,
+        "text": "",
+        "title": f"섹션 {i} (추출 실패)",
+        "error": str(error)
+    }
+
+
+def _join_pages(page_map: Dict[int, Any], pages: List[int]) -> Any:
+    """페이지별 결과를 섹션 본문 결과로 합침 (페이지 하나라도 실패하면 그 에러 반환)"""
+    texts = []
+    for page in pages:
+        result = page_map[page]
+        if isinstance(result, BaseException):
+            return result
+        texts.append(result.get("plain", ""))
+    return {"plain": settings.PAGE_TEXT_SEPARATOR.join(texts)}
+
+
+def _build_sections(
+    sections: List[Dict[str, Any]],
+    requests: List[tuple],
+    contents: List[Any]
+) -> None:
+    """추출한 본문으로 섹션 메타데이터를 일괄 생성하여 sections에 채움 (스레드에서 실행)"""
+    for (index, item, pages), content in zip(requests, contents):
+        try:
+            if isinstance(content, BaseException):
+                raise content
+            sections[index] = _build_section(index + 1, item, pages, content.get("plain", ""))
+        except Exception as e:
+            sections[index] = _failed_section(index + 1, item, e)
+
+
 async def node_extract_ranges(state: ParserState) -> ParserState:
     """
     범위 기반 본문 추출 노드
@@ -289,58 +762,23 @@ async def node_extract_ranges(state: ParserState) -> ParserState:
         
         logger.info(f"범위 추출 시작: {len(parsed_items)}개 섹션")
         
-        sections = []
+        sections: List[Dict[str, Any]] = [None] * len(parsed_items)
         
-        for i, item in enumerate(parsed_items, 1):
+        # 섹션별 페이지 범위 계산 (잘못된 범위는 실패 섹션으로 처리)
+        requests = []
+        for index, item in enumerate(parsed_items):
             try:
-                start_page = int(item.get("page_start", 0))
-                end_page = int(item.get("page_end", start_page))
-                pages = list(range(start_page, end_page + 1)) if end_page >= start_page else [start_page]
-                
-                # MCP로 본문 추출
-                content_result = await pdf_read(doc_id, pages, mode="plain")
-                full_content = content_result.get("plain", "")
-                
-                # 제목 우선순위: jo > kwan > level_3 > level_2 > level_1
-                title = (
-                    item.get("jo") or 
-                    item.get("kwan") or 
-                    item.get("level_3") or 
-                    item.get("level_2") or 
-                    item.get("level_1") or 
-                    f"섹션 {i}"
-                )
-                
-                # 제목 이후 본문 추출
-                pure_content = extract_content_after_title(full_content, title)
-                
-                # 메타데이터 생성
-                meta = {
-                    "text": pure_content,
-                    "para_count": pure_content.count("\n\n") + 1 if pure_content.strip() else 0,
-                    "char_count": len(pure_content.strip()),
-                    "has_table": ("표" in pure_content) or ("Table" in pure_content),
-                    "has_figure": ("그림" in pure_content) or ("Figure" in pure_content) or ("도" in pure_content),
-                    "pages": pages,
-                    "title": title,
-                    "section_id": i
-                }
-                
-                # 원본 데이터와 메타데이터 병합
-                section = {**item, **meta}
-                sections.append(section)
-                
-                logger.debug(f"섹션 {i} 추출 완료: {len(pure_content)}자")
-                
+                requests.append((index, item, _section_pages(item)))
             except Exception as e:
-                logger.error(f"섹션 {i} 추출 실패: {e}")
-                # 실패한 섹션도 기본 정보로 추가
-                sections.append({
-                    **item,
-                    "text": "",
-                    "title": f"섹션 {i} (추출 실패)",
-                    "error": str(e)
-                })
+                sections[index] = _failed_section(index + 1, item, e)
+        
+        # 섹션 간 겹치는 페이지는 한 번만 읽도록 고유 페이지 단위로 MCP 배치 요청
+        all_pages = {page for _, _, pages in requests for page in pages}
+        page_map = await pdf_read_pages(doc_id, list(all_pages), mode="plain")
+        contents = [_join_pages(page_map, pages) for _, _, pages in requests]
+        
+        # 메타데이터 생성 (제목 fuzzy 매칭 등 CPU 작업은 문서당 한 번 스레드에서 일괄 실행)
+        await asyncio.to_thread(_build_sections, sections, requests, contents)
         
         # 상태 업데이트
         state["sections"] = sections
@@ -358,6 +796,25 @@ async def node_extract_ranges(state: ParserState) -> ParserState:
         return set_error(state, f"범위 추출 실패: {str(e)}")
 
 
+# 스레드 작업 하나에서 연속으로 저장할 섹션 파일 수
+SECTION_WRITE_BATCH_SIZE = 64
+
+
+def _write_files_sync(files: List[tuple]) -> None:
+    """(경로, UTF-8 바이트) 목록의 파일을 차례로 저장 (스레드에서 실행)"""
+    for path, content in files:
+        with open(path, "wb") as f:
+            f.write(content)
+
+
+def _write_csv_sync(csv_path: str, headers: List[str], rows: List[List[Any]]) -> None:
+    """CSV 파일 저장 (스레드에서 실행)"""
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
 async def node_write_csv(state: ParserState) -> ParserState:
     """
     CSV 저장 노드
@@ -385,6 +842,7 @@ async def node_write_csv(state: ParserState) -> ParserState:
         ]
         
         rows = []
+        files = []
         
         # 각 섹션 처리
         for section in sections:
@@ -394,13 +852,9 @@ async def node_write_csv(state: ParserState) -> ParserState:
             extract_path = os.path.join(base_dir, f"section_{section_id}.txt")
             json_path = os.path.join(base_dir, f"section_{section_id}.json")
             
-            # 텍스트 파일 저장
-            with open(extract_path, "w", encoding="utf-8") as f:
-                f.write(section.get("text", ""))
-            
-            # JSON 파일 저장 (메타데이터 포함)
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(section, f, ensure_ascii=False, indent=2)
+            # 텍스트 및 JSON 파일 내용 (메타데이터 포함, 아래에서 배치로 저장)
+            files.append((extract_path, section.get("text", "").encode("utf-8")))
+            files.append((json_path, orjson.dumps(section, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)))
             
             # CSV 행 데이터
             rows.append([
@@ -422,12 +876,15 @@ async def node_write_csv(state: ParserState) -> ParserState:
                 os.path.relpath(json_path, settings.OUTPUT_DIR)
             ])
         
+        # 섹션 파일 저장 (배치 단위로 스레드에 넘겨 파일마다 스레드를 오가는 비용을 줄임)
+        await asyncio.gather(*(
+            asyncio.to_thread(_write_files_sync, files[i:i + SECTION_WRITE_BATCH_SIZE])
+            for i in range(0, len(files), SECTION_WRITE_BATCH_SIZE)
+        ))
+        
         # CSV 파일 저장
         csv_path = os.path.join(settings.OUTPUT_DIR, f"{doc_id}_parsed.csv")
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            writer.writerows(rows)
+        await asyncio.to_thread(_write_csv_sync, csv_path, headers, rows)
         
         # 상태 업데이트
         state["csv_path"] = csv_path
@@ -458,6 +915,17 @@ async def node_fail(state: ParserState) -> ParserState:
     return state
 
 
+@lru_cache(maxsize=4096)
+def _title_pattern(title: str) -> Optional[re.Pattern]:
+    """
+    제목별 공백 무시 매칭 정규식
+    
+    약관 제목(제1조, 제2관 등)은 문서 간에 반복되므로 제목마다 한 번만 컴파일해 재사용합니다.
+    """
+    chars = [re.escape(ch) for ch in title if not ch.isspace()]
+    return re.compile(r"\s*".join(chars)) if chars else None
+
+
 def extract_content_after_title(full_content: str, title: str) -> str:
     """
     제목 이후의 본문 내용 추출
@@ -477,9 +945,22 @@ def extract_content_after_title(full_content: str, title: str) -> str:
     if pos != -1:
         return full_content[pos + len(title):].strip()
     
+    # 공백 차이만 있는 매칭 시도 (예: "제1조 (목적)" ↔ "제1조(목적)")
+    pattern = _title_pattern(title)
+    if pattern is not None:
+        match = pattern.search(full_content)
+        if match:
+            return full_content[match.end():].strip()
+    
     # fuzzy 매칭 fallback
+    if RAPIDFUZZ_AVAILABLE:
+        # 제목과 가장 비슷한 부분 문자열 위치 탐색 (C++ 구현, 유사도 80 이상만 채택)
+        alignment = fuzz.partial_ratio_alignment(title.lower(), full_content.lower(), score_cutoff=80)
+        if alignment is not None:
+            return full_content[alignment.dest_end:].strip()
+        return full_content
+    
     try:
-        import difflib
         matcher = difflib.SequenceMatcher(None, title.lower(), full_content.lower())
         match = matcher.find_longest_match(0, len(title), 0, len(full_content))
         
@@ -1,26 +1,44 @@
 """
 FastAPI 메인 애플리케이션
 """
+import asyncio
+import atexit
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 
 from .config import settings
 from .api.main import api_router
 
-# 로깅 설정
+# 로깅 설정 (로그 기록은 큐에 넣기만 하고, 실제 콘솔/파일 쓰기는 리스너 스레드에서 처리)
+_log_formatter = logging.Formatter(settings.LOG_FORMAT)
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler("app.log", encoding="utf-8")
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# 큐에는 메시지만 담고 최종 포맷은 리스너 쪽 핸들러에서 적용
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
-    format=settings.LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("app.log", encoding="utf-8")
-    ]
+    handlers=[_queue_handler]
 )
 
 logger = logging.getLogger(__name__)
@@ -42,13 +60,25 @@ async def lifespan(app: FastAPI):
         logger.info(f"디렉토리 초기화 완료: {settings.UPLOAD_DIR}, {settings.OUTPUT_DIR}")
         
         # OpenRouter 모델 검증
-        from .clients.openrouter_client import validate_model
+        from .clients.openrouter_client import validate_model, get_llm_client
         if not validate_model(settings.OPENROUTER_MODEL):
             raise ValueError(f"허용되지 않은 모델: {settings.OPENROUTER_MODEL}")
         logger.info(f"OpenRouter 모델 검증 완료: {settings.OPENROUTER_MODEL}")
         
-        # LangGraph 파이프라인 초기화
+        # LLM 클라이언트 미리 생성 (첫 요청에서 SDK/연결 풀 생성 지연 제거)
+        get_llm_client()
+        
+        # 프롬프트 캐시 접두부 길이 확인 (토크나이저 로드가 네트워크를 쓸 수 있어 스레드에서 실행, 실패해도 계속)
+        from .prompts.insurance_prompts import cached_prefix_tokens
+        try:
+            prefix_tokens = await asyncio.to_thread(cached_prefix_tokens)
+            logger.info(f"프롬프트 캐시 접두부 토큰 수: {prefix_tokens}")
+        except Exception as e:
+            logger.warning(f"프롬프트 캐시 접두부 토큰 수 계산 실패 (무시): {e}")
+        
+        # LangGraph 파이프라인 초기화 (컴파일된 그래프를 재사용)
         from .langgraph.graph import default_manager
+        app.state.graph = default_manager.graph
         graph_status = default_manager.get_status()
         logger.info(f"LangGraph 파이프라인 초기화 완료: {graph_status}")
         
@@ -62,6 +92,13 @@ async def lifespan(app: FastAPI):
     
     # 종료 시 정리
     logger.info("애플리케이션 종료 중...")
+    
+    from .clients.mcp_client import aclose_clients
+    await aclose_clients()
+    
+    from .clients.openrouter_client import aclose_llm_client
+    await aclose_llm_client()
+    
     logger.info("애플리케이션 종료 완료")
 
 
@@ -73,6 +110,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -85,6 +123,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GZip 압축 미들웨어 설정 (섹션 목록 등 대용량 JSON 응답 압축)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL
+)
+
 # Trusted Host 미들웨어 설정
 if not settings.DEBUG:
     app.add_middleware(
@@ -2,16 +2,22 @@
 API 요청/응답 스키마 정의
 """
 from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def utc_now() -> datetime:
+    """현재 UTC 시간 (timezone 포함, datetime.utcnow 대체)"""
+    return datetime.now(timezone.utc)
 
 
 # 기본 응답 스키마
 class BaseResponse(BaseModel):
     """기본 API 응답"""
+    model_config = ConfigDict(frozen=True)
     status: int = Field(..., description="HTTP 상태 코드")
     message: str = Field(..., description="응답 메시지")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="응답 시간")
+    timestamp: datetime = Field(default_factory=utc_now, description="응답 시간")
 
 
 class ErrorResponse(BaseResponse):
@@ -23,6 +29,7 @@ class ErrorResponse(BaseResponse):
 # 파싱 관련 스키마
 class ParseRequest(BaseModel):
     """파싱 요청"""
+    model_config = ConfigDict(frozen=True)
     doc_id: str = Field(..., description="문서 ID", min_length=1)
     window_size: Optional[int] = Field(default=5, description="목차 탐지 윈도우 크기", ge=1, le=20)
     use_checkpointer: Optional[bool] = Field(default=False, description="SQLite 체크포인터 사용 여부")
@@ -30,6 +37,7 @@ class ParseRequest(BaseModel):
 
 class SectionInfo(BaseModel):
     """섹션 정보"""
+    model_config = ConfigDict(frozen=True)
     section_id: int = Field(..., description="섹션 ID")
     level_1: Optional[str] = Field(None, description="1단계 제목")
     level_2: Optional[str] = Field(None, description="2단계 제목") 
@@ -49,6 +57,7 @@ class SectionInfo(BaseModel):
 
 class ParseProgress(BaseModel):
     """파싱 진행 상태"""
+    model_config = ConfigDict(frozen=True)
     doc_id: str = Field(..., description="문서 ID")
     job_status: str = Field(..., description="작업 상태")
     progress_percent: float = Field(default=0.0, description="진행률 (%)", ge=0.0, le=100.0)
@@ -84,6 +93,7 @@ class ParseFailure(BaseResponse):
 # 문서 관리 스키마
 class DocumentInfo(BaseModel):
     """문서 정보"""
+    model_config = ConfigDict(frozen=True)
     doc_id: str = Field(..., description="문서 ID")
     filename: Optional[str] = Field(None, description="파일명")
     page_count: int = Field(..., description="페이지 수", ge=0)
@@ -102,6 +112,7 @@ class DocumentList(BaseResponse):
 
 class SectionDetail(BaseModel):
     """섹션 상세 정보"""
+    model_config = ConfigDict(frozen=True)
     section_info: SectionInfo = Field(..., description="섹션 기본 정보")
     content: str = Field(default="", description="섹션 본문")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="추가 메타데이터")
@@ -119,14 +130,16 @@ class SectionsList(BaseResponse):
 # 시스템 관리 스키마
 class HealthCheck(BaseModel):
     """헬스체크"""
+    model_config = ConfigDict(frozen=True)
     status: str = Field(default="healthy", description="시스템 상태")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="체크 시간")
+    timestamp: datetime = Field(default_factory=utc_now, description="체크 시간")
     services: Dict[str, str] = Field(default_factory=dict, description="서비스 상태")
     version: str = Field(default="0.1.0", description="애플리케이션 버전")
 
 
 class SystemInfo(BaseModel):
     """시스템 정보"""
+    model_config = ConfigDict(frozen=True)
     app_name: str = Field(default="parsing-graph", description="애플리케이션 이름")
     version: str = Field(default="0.1.0", description="버전")
     environment: str = Field(default="development", description="환경")
@@ -137,6 +150,7 @@ class SystemInfo(BaseModel):
 
 class JobStatusUpdate(BaseModel):
     """작업 상태 업데이트"""
+    model_config = ConfigDict(frozen=True)
     doc_id: str = Field(..., description="문서 ID")
     status: str = Field(..., description="새로운 상태")
     message: Optional[str] = Field(None, description="상태 메시지")
@@ -146,6 +160,7 @@ class JobStatusUpdate(BaseModel):
 # 검색 및 필터 스키마
 class SearchQuery(BaseModel):
     """검색 쿼리"""
+    model_config = ConfigDict(frozen=True)
     query: str = Field(..., description="검색어", min_length=1)
     doc_id: Optional[str] = Field(None, description="특정 문서 ID로 제한")
     section_type: Optional[str] = Field(None, description="섹션 타입 필터")
@@ -154,6 +169,7 @@ class SearchQuery(BaseModel):
 
 class SearchResult(BaseModel):
     """검색 결과"""
+    model_config = ConfigDict(frozen=True)
     doc_id: str = Field(..., description="문서 ID")
     section_id: int = Field(..., description="섹션 ID")
     title: str = Field(..., description="섹션 제목")
@@ -174,6 +190,7 @@ class SearchResponse(BaseResponse):
 # 통계 스키마
 class ParsingStats(BaseModel):
     """파싱 통계"""
+    model_config = ConfigDict(frozen=True)
     total_documents: int = Field(default=0, description="총 문서 수")
     completed_parsing: int = Field(default=0, description="파싱 완료 문서 수")
     failed_parsing: int = Field(default=0, description="파싱 실패 문서 수")
@@ -1,8 +1,14 @@
 """
 LangGraph 상태 정의
 """
+import logging
+from datetime import datetime
 from typing import TypedDict, List, Dict, Optional, Any
 
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
 
 class ParserState(TypedDict, total=False):
     """
@@ -27,7 +33,8 @@ class ParserState(TypedDict, total=False):
 
     # 로깅/상태 관리
     job_status: str               # 작업 상태: idle | running | detected | parsed | extracted | completed | failed
-    logs: List[str]               # 처리 로그 목록
+    logs: List[str]               # 처리 로그 목록 (최근 MAX_STATE_LOGS개)
+    dropped_logs: int             # 상태에서 제거된 오래된 로그 수
     error: Optional[str]          # 에러 메시지 (실패 시)
 
     # 추가 메타데이터
@@ -52,6 +59,12 @@ class JobStatus:
     FAILED = "failed"            # 실패
 
 
+# 유효한 작업 상태 값 (상태 상수는 식별자 형태의 리터럴이라 CPython이 이미 intern하므로 비교는 포인터 비교로 끝남)
+JOB_STATUSES = frozenset(
+    value for name, value in vars(JobStatus).items() if not name.startswith("_")
+)
+
+
 def create_initial_state(doc_id: str, window_size: int = 5) -> ParserState:
     """
     초기 상태 생성
@@ -63,8 +76,7 @@ def create_initial_state(doc_id: str, window_size: int = 5) -> ParserState:
     Returns:
         초기화된 ParserState
     """
-    from datetime import datetime
-    
+    now = datetime.utcnow().isoformat()
     return ParserState(
         doc_id=doc_id,
         window_size=window_size,
@@ -72,11 +84,29 @@ def create_initial_state(doc_id: str, window_size: int = 5) -> ParserState:
         toc_pages=[],
         logs=[],
         job_status=JobStatus.IDLE,
-        created_at=datetime.utcnow().isoformat(),
-        updated_at=datetime.utcnow().isoformat(),
+        created_at=now,
+        updated_at=now,
     )
 
 
+def _append_log(state: ParserState, entry: str) -> None:
+    """
+    로그 추가 (최근 MAX_STATE_LOGS개만 상태에 보관)
+    
+    상태가 커지면 노드 간 전달/체크포인트 직렬화 비용도 커지므로,
+    한도를 넘은 오래된 로그는 애플리케이션 로그 파일에 남기고 상태에서는 제거합니다.
+    """
+    logs = state.setdefault("logs", [])
+    logs.append(entry)
+    
+    overflow = len(logs) - settings.MAX_STATE_LOGS
+    if overflow > 0:
+        for old_entry in logs[:overflow]:
+            logger.info(f"[{state.get('doc_id')}] {old_entry}")
+        del logs[:overflow]
+        state["dropped_logs"] = state.get("dropped_logs", 0) + overflow
+
+
 def update_state_status(state: ParserState, status: str, log_message: str = "") -> ParserState:
     """
     상태 업데이트 헬퍼 함수
@@ -88,14 +118,18 @@ def update_state_status(state: ParserState, status: str, log_message: str = "")
         
     Returns:
         업데이트된 상태
+        
+    Raises:
+        ValueError: JobStatus에 없는 상태 값인 경우
     """
-    from datetime import datetime
+    if status not in JOB_STATUSES:
+        raise ValueError(f"알 수 없는 작업 상태: {status}")
     
     state["job_status"] = status
     state["updated_at"] = datetime.utcnow().isoformat()
     
     if log_message:
-        state.setdefault("logs", []).append(f"[{status}] {log_message}")
+        _append_log(state, f"[{status}] {log_message}")
     
     return state
 
@@ -112,13 +146,12 @@ def add_log(state: ParserState, message: str, level: str = "INFO") -> ParserStat
     Returns:
         로그가 추가된 상태
     """
-    from datetime import datetime
-    
-    timestamp = datetime.utcnow().strftime("%H:%M:%S")
-    log_entry = f"[{timestamp}] {level}: {message}"
+    # 시각은 한 번만 조회해 로그 타임스탬프와 updated_at에 함께 사용
+    now = datetime.utcnow()
+    log_entry = f"[{now:%H:%M:%S}] {level}: {message}"
     
-    state.setdefault("logs", []).append(log_entry)
-    state["updated_at"] = datetime.utcnow().isoformat()
+    _append_log(state, log_entry)
+    state["updated_at"] = now.isoformat()
     
     return state
 
@@ -0,0 +1,76 @@
+"""
+LLM 공급자별 메시지 변환
+
+프롬프트 빌더는 시스템 메시지(시스템 프롬프트 + 고정 지시문)와 사용자 메시지(호출마다 달라지는 정보)로
+나눈 메시지 목록을 반환하고, 고정 지시문 블록에 cache_control 표시를 붙입니다.
+OpenRouter는 Anthropic/Gemini 모델에 cache_control을 그대로 전달하고,
+OpenAI 모델은 1024토큰 이상 공통 접두부를 자동으로 캐시하므로 표시를 제거해 보냅니다.
+"""
+from typing import Any, Dict, List
+
+Messages = List[Dict[str, Any]]
+
+# 명시적 프롬프트 캐시 표시
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+# cache_control 표시를 전달할 모델 접두사 (OpenRouter 모델명 기준)
+CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+
+
+def build_cached_messages(system_prompt: str, template: str, user_content: str) -> Messages:
+    """
+    고정 접두부를 캐시 가능한 시스템 메시지로 분리한 메시지 목록 생성
+    
+    Args:
+        system_prompt: 공통 시스템 프롬프트
+        template: 작업별 고정 지시문 (cache_control 표시 대상)
+        user_content: 호출마다 달라지는 사용자 메시지
+    
+    Returns:
+        [system, user] 메시지 목록
+    """
+    return [
+        {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": system_prompt},
+                {"type": "text", "text": template, "cache_control": EPHEMERAL_CACHE_CONTROL},
+            ]
+        },
+        {"role": "user", "content": user_content},
+    ]
+
+
+def to_anthropic(messages: Messages) -> Messages:
+    """
+    cache_control 표시 유지 (Anthropic 형식)
+    
+    표시가 없는 메시지 목록이면 시스템 메시지의 마지막 블록에 표시를 붙입니다.
+    """
+    converted = []
+    for message in messages:
+        content = message["content"]
+        if message["role"] == "system" and isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        if message["role"] == "system" and not any("cache_control" in part for part in content):
+            content = content[:-1] + [{**content[-1], "cache_control": EPHEMERAL_CACHE_CONTROL}]
+        converted.append({**message, "content": content})
+    return converted
+
+
+def to_openai(messages: Messages) -> Messages:
+    """cache_control 표시 제거 후 텍스트 블록을 문자열 하나로 합침 (OpenAI 자동 접두부 캐시 사용)"""
+    converted = []
+    for message in messages:
+        content = message["content"]
+        if not isinstance(content, str):
+            content = "\n\n".join(part["text"] for part in content)
+        converted.append({**message, "content": content})
+    return converted
+
+
+def adapt_messages(messages: Messages, model: str) -> Messages:
+    """모델 공급자에 맞게 메시지 목록 변환"""
+    if model.startswith(CACHE_CONTROL_MODEL_PREFIXES):
+        return to_anthropic(messages)
+    return to_openai(messages)
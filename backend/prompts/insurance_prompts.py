@@ -1,8 +1,19 @@
 """
 보험약관 전용 AI 프롬프트 템플릿
 """
-from typing import Dict, Any, List
+import logging
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Union
 
+import orjson
+
+from .adapters import Messages, build_cached_messages
+from .tokens import count_tokens, truncate_tokens
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트 템플릿 버전 (템플릿 수정 시 올리면 LLM 응답 캐시가 자동으로 무효화됨)
+PROMPT_VERSION = "v2"
 
 # 목차 페이지 탐지 프롬프트 (5페이지 윈도우)
 TOC_DETECT_PROMPT = """
@@ -31,6 +42,39 @@ TOC_DETECT_PROMPT = """
 """
 
 
+# 여러 윈도우 동시 목차 탐지 프롬프트 (윈도우 목록은 뒤에 덧붙임)
+TOC_DETECT_BATCH_PROMPT = """
+아래에 나열된 여러 페이지 윈도우 각각에 대해 보험약관의 목차(Table of Contents)가 포함된 페이지들을 찾아주세요.
+
+판단 기준:
+1) 보험약관 구조 (가이드북, 주계약약관, 특별약관 등)
+2) 계층적 제목 나열 (제X관, 제X조 등)
+3) 페이지 번호가 함께 표시
+4) 목차라는 명시적 표시 또는 차례, Contents 등의 표현
+5) 들여쓰기된 계층 구조
+
+모든 윈도우에 대해 하나씩, 반드시 아래 JSON 형식으로만 출력하세요:
+{
+    "results": [
+        {
+            "window_id": 윈도우_번호_정수,
+            "toc_pages": [0기준_페이지_인덱스_정수_배열],
+            "confidence": 0.0~1.0_신뢰도,
+            "reason": "판단근거_설명"
+        }
+    ]
+}
+
+예시:
+{
+    "results": [
+        {"window_id": 0, "toc_pages": [2, 3], "confidence": 0.95, "reason": "페이지 3-4에서 전형적인 보험약관 목차 구조와 페이지 번호 확인"},
+        {"window_id": 1, "toc_pages": [], "confidence": 0.9, "reason": "본문 조항만 있고 목차 구조 없음"}
+    ]
+}
+"""
+
+
 # 보험약관 전용 목차 파싱 프롬프트  
 INSURANCE_TOC_PARSING_PROMPT = """
 ### 역할
@@ -98,7 +142,20 @@ INSURANCE_TOC_PARSING_PROMPT = """
 """
 
 
-def get_toc_detect_prompt(doc_info: Dict[str, Any], window_pages: List[int]) -> str:
+# 프롬프트 접두부 (앞뒤 공백을 정리한 고정 지시문, 호출 간 바이트 단위로 동일)
+_TOC_DETECT_PREFIX = TOC_DETECT_PROMPT.strip()
+_TOC_DETECT_BATCH_PREFIX = TOC_DETECT_BATCH_PROMPT.strip()
+_TOC_PARSING_PREFIX = INSURANCE_TOC_PARSING_PROMPT.strip()
+
+# 본문 분석 프롬프트에 넣을 본문 최대 토큰 수 (토크나이저가 없으면 최대 문자 수)
+CONTENT_ANALYSIS_MAX_TOKENS = 1500
+CONTENT_ANALYSIS_MAX_CHARS = 2000
+
+# 목차 파싱 사용자 메시지의 스팬 데이터 앞부분
+_TOC_PARSING_HEADER = "### 분석할 스팬 데이터:\n"
+
+
+def get_toc_detect_prompt(doc_info: Dict[str, Any], window_pages: List[int]) -> Messages:
     """
     목차 탐지 프롬프트 생성
     
@@ -107,38 +164,53 @@ def get_toc_detect_prompt(doc_info: Dict[str, Any], window_pages: List[int]) ->
         window_pages: 현재 윈도우의 페이지 번호들
         
     Returns:
-        완성된 프롬프트
+        메시지 목록 (고정 지시문은 캐시 가능한 시스템 메시지, 문서 정보는 사용자 메시지)
     """
-    context = f"""
-문서 정보:
+    return build_cached_messages(SYSTEM_PROMPT, _TOC_DETECT_PREFIX, f"""### 문서 정보:
 - 문서 ID: {doc_info.get('doc_id', 'Unknown')}
 - 분석 페이지: {window_pages}
-- 윈도우 크기: {len(window_pages)}페이지
+- 윈도우 크기: {len(window_pages)}페이지""")
 
-{TOC_DETECT_PROMPT}
-"""
-    return context.strip()
+
+def get_toc_detect_prompt_batch(doc_info: Dict[str, Any], windows: List[List[int]]) -> Messages:
+    """
+    여러 윈도우 목차 탐지 프롬프트 생성
+    
+    고정 지시문을 한 번만 보내고 윈도우별 페이지 목록을 번호와 함께 나열합니다.
+    응답은 window_id별 결과 배열입니다.
+    
+    Args:
+        doc_info: 문서 정보 (doc_id, 메타데이터 등)
+        windows: 윈도우별 페이지 번호 목록
+        
+    Returns:
+        메시지 목록 (고정 지시문은 캐시 가능한 시스템 메시지, 윈도우 목록은 사용자 메시지)
+    """
+    window_lines = "\n".join(
+        f"## 윈도우 {window_id}: 페이지 {pages} ({len(pages)}페이지)"
+        for window_id, pages in enumerate(windows)
+    )
+    return build_cached_messages(SYSTEM_PROMPT, _TOC_DETECT_BATCH_PREFIX, f"""### 문서 정보:
+- 문서 ID: {doc_info.get('doc_id', 'Unknown')}
+- 윈도우 수: {len(windows)}
+
+{window_lines}""")
 
 
-def get_toc_parsing_prompt(spans_data: List[str]) -> str:
+def get_toc_parsing_prompt(spans_data: Union[str, List[str]]) -> Messages:
     """
     목차 파싱 프롬프트 생성
     
     Args:
-        spans_data: 정제된 스팬 텍스트 블록 리스트
+        spans_data: 정제된 스팬 텍스트 블록 (줄바꿈으로 이어 붙인 문자열 또는 리스트)
         
     Returns:
-        완성된 프롬프트
+        메시지 목록 (파싱 지시문은 캐시 가능한 시스템 메시지, 스팬 데이터는 사용자 메시지)
     """
-    spans_text = "\n".join(spans_data)
+    spans_text = spans_data if isinstance(spans_data, str) else "\n".join(spans_data)
     
-    prompt = f"""
-{INSURANCE_TOC_PARSING_PROMPT}
-
-### 분석할 스팬 데이터:
-{spans_text}
-"""
-    return prompt.strip()
+    # 고정 헤더 뒤에 스팬 데이터만 이어 붙임 (대용량 스팬 문자열은 한 번만 복사)
+    return build_cached_messages(SYSTEM_PROMPT, _TOC_PARSING_PREFIX, _TOC_PARSING_HEADER + spans_text.rstrip())
 
 
 def get_content_analysis_prompt(content: str, title: str) -> str:
@@ -152,6 +224,10 @@ def get_content_analysis_prompt(content: str, title: str) -> str:
     Returns:
         본문 분석 프롬프트
     """
+    # 문자 수가 아닌 토큰 수 기준으로 잘라 호출당 입력 토큰을 일정하게 유지
+    truncated, was_truncated = truncate_tokens(
+        content, CONTENT_ANALYSIS_MAX_TOKENS, CONTENT_ANALYSIS_MAX_CHARS
+    )
     return f"""
 다음 보험약관 섹션의 내용을 분석하여 주요 정보를 추출해주세요.
 
@@ -165,7 +241,7 @@ def get_content_analysis_prompt(content: str, title: str) -> str:
 5. 특이사항
 
 본문:
-{content[:2000]}{'...(내용 생략)' if len(content) > 2000 else ''}
+{truncated}{'...(내용 생략)' if was_truncated else ''}
 
 JSON 형식으로 응답:
 {{
@@ -193,7 +269,7 @@ def get_validation_prompt(parsed_data: Dict[str, Any]) -> str:
 다음 보험약관 목차 파싱 결과를 검증해주세요.
 
 파싱 결과:
-{parsed_data}
+{orjson.dumps(parsed_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()}
 
 검증 항목:
 1. 계층 구조의 논리적 일관성
@@ -212,7 +288,7 @@ JSON 형식으로 응답:
 """
 
 
-# 시스템 프롬프트
+# 시스템 프롬프트 (매 호출에 그대로 전송되므로 import 시 앞뒤 공백 정리)
 SYSTEM_PROMPT = """
 당신은 보험약관 문서 처리 전문가입니다. OpenRouter를 통해 고품질 AI 모델을 활용하여 정확한 분석을 수행합니다.
 
@@ -224,4 +300,36 @@ SYSTEM_PROMPT = """
 
 항상 JSON 형식으로 구조화된 응답을 제공하며,
 보험업계 표준과 법적 요구사항을 준수합니다.
-"""
\ No newline at end of file
+""".strip()
+
+
+# 공급자 명시적 프롬프트 캐시의 최소 접두부 토큰 수 (Anthropic 기준, 이보다 짧으면 캐시되지 않음)
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+
+@lru_cache(maxsize=1)
+def cached_prefix_tokens() -> Dict[str, Optional[int]]:
+    """
+    캐시 대상 시스템 메시지(SYSTEM_PROMPT + 고정 지시문)의 토큰 수 계산 (첫 호출 시 한 번만 계산)
+    
+    최소 토큰 수보다 짧은 접두부는 cache_control을 붙여도 캐시되지 않으므로 경고를 남깁니다.
+    토크나이저를 사용할 수 없으면 None입니다. 토크나이저 로드에 인코딩 파일 다운로드가 필요할 수 있으므로
+    import 시점이 아니라 애플리케이션 시작 시 스레드에서 호출합니다.
+    """
+    prefixes = {
+        "TOC_DETECT_PROMPT": _TOC_DETECT_PREFIX,
+        "TOC_DETECT_BATCH_PROMPT": _TOC_DETECT_BATCH_PREFIX,
+        "INSURANCE_TOC_PARSING_PROMPT": _TOC_PARSING_PREFIX,
+    }
+    
+    token_counts: Dict[str, Optional[int]] = {}
+    for name, template in prefixes.items():
+        # 공급자 변환 후 시스템 메시지와 같은 형태로 계산
+        tokens = count_tokens(f"{SYSTEM_PROMPT}\n\n{template}")
+        if tokens is not None and tokens < PROMPT_CACHE_MIN_TOKENS:
+            logger.warning(
+                f"{name} 캐시 접두부가 {tokens}토큰으로 프롬프트 캐시 최소 {PROMPT_CACHE_MIN_TOKENS}토큰보다 짧습니다 "
+                f"(Anthropic 모델에서는 캐시되지 않음, 예시를 추가해 길이를 늘리는 것을 고려하세요)"
+            )
+        token_counts[name] = tokens
+    return token_counts
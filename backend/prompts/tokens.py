@@ -0,0 +1,73 @@
+"""
+프롬프트 토큰 수 계산
+
+tiktoken이 설치되어 있으면 OpenAI 토크나이저로 정확한 토큰 수를 계산합니다.
+tiktoken을 사용할 수 없으면 count_tokens는 None을 반환하고, truncate_tokens는 문자 수 기준으로 자릅니다.
+"""
+import logging
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+# 선택적 토크나이저 (tiktoken 패키지 필요)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# GPT-4o/GPT-5 계열 토크나이저
+TOKEN_ENCODING = "o200k_base"
+
+# 토큰 하나가 차지하는 최대 문자 수 추정치 (긴 본문은 이만큼만 잘라서 인코딩)
+MAX_CHARS_PER_TOKEN = 8
+
+
+@lru_cache(maxsize=1)
+def get_encoding() -> Optional[Any]:
+    """
+    토크나이저 반환 (첫 호출 시 한 번만 로드)
+    
+    tiktoken이 없거나 인코딩 파일을 받을 수 없으면 (오프라인 등) None이며, 실패 결과도 캐시합니다.
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception as e:
+        logger.warning(f"토크나이저 로드 실패 (문자 수 기준으로 처리): {TOKEN_ENCODING}, {e}")
+        return None
+
+
+def count_tokens(text: str) -> Optional[int]:
+    """텍스트 토큰 수 (토크나이저를 사용할 수 없으면 None)"""
+    encoding = get_encoding()
+    if encoding is None:
+        return None
+    return len(encoding.encode(text))
+
+
+def truncate_tokens(text: str, max_tokens: int, fallback_chars: int) -> Tuple[str, bool]:
+    """
+    텍스트를 토큰 수 기준으로 자르기
+    
+    Args:
+        text: 원본 텍스트
+        max_tokens: 최대 토큰 수
+        fallback_chars: 토크나이저를 사용할 수 없을 때의 최대 문자 수
+        
+    Returns:
+        (잘린 텍스트, 잘렸는지 여부)
+    """
+    encoding = get_encoding()
+    if encoding is None:
+        return text[:fallback_chars], len(text) > fallback_chars
+    
+    # 긴 본문 전체를 인코딩하지 않도록 예산을 넘는 뒷부분은 미리 제외
+    head = text[:max_tokens * MAX_CHARS_PER_TOKEN]
+    token_ids = encoding.encode(head)
+    if len(token_ids) <= max_tokens:
+        return head, len(head) < len(text)
+    return encoding.decode(token_ids[:max_tokens]), True
@@ -2,9 +2,9 @@
 """
 백엔드 서버 시작 스크립트
 """
+import importlib.util
 import os
 import sys
-import subprocess
 import time
 from pathlib import Path
 
@@ -12,6 +12,9 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 BACKEND_DIR = PROJECT_ROOT / "backend"
 
+# 서버 실행에 필요한 모듈
+REQUIRED_MODULES = ("fastapi", "openai", "langgraph")
+
 def check_requirements():
     """필수 요구사항 확인"""
     print("🔍 필수 요구사항 확인 중...")
@@ -27,17 +30,15 @@ def check_requirements():
         print("❌ .env 파일이 없습니다. .env.example을 참고하여 생성하세요.")
         return False
     
-    # 의존성 확인
-    try:
-        import fastapi
-        import openai
-        import langgraph
-        print("✅ 필수 의존성 확인 완료")
-        return True
-    except ImportError as e:
-        print(f"❌ 필수 의존성 누락: {e}")
+    # 의존성 확인 (모듈을 실제로 import하지 않고 설치 여부만 확인)
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ 필수 의존성 누락: {', '.join(missing)}")
         print("pip install -r requirements.txt 실행하세요.")
         return False
+    
+    print("✅ 필수 의존성 확인 완료")
+    return True
 
 def start_server():
     """FastAPI 서버 시작"""
@@ -45,22 +46,25 @@ def start_server():
     
     os.chdir(PROJECT_ROOT)
     
-    cmd = [
-        sys.executable, "-m", "uvicorn",
-        "backend.main:app",
-        "--host", "0.0.0.0",
-        "--port", "8000",
-        "--reload",
-        "--log-level", "info"
-    ]
+    # 별도 인터프리터를 띄우지 않고 현재 프로세스에서 uvicorn 실행
+    import uvicorn
     
     try:
-        subprocess.run(cmd, check=True)
+        uvicorn.run(
+            "backend.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info",
+            app_dir=str(PROJECT_ROOT)
+        )
     except KeyboardInterrupt:
         print("\n👋 서버 종료")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ 서버 시작 실패: {e}")
-        return False
+    except SystemExit as e:
+        # uvicorn은 앱 로드/포트 바인딩 실패 시 sys.exit(1)로 종료
+        if e.code:
+            print(f"❌ 서버 시작 실패: 종료 코드 {e.code}")
+            return False
     
     return True
 
@@ -0,0 +1,8 @@
+"""
+테스트 공통 설정
+
+backend.config는 임포트 시점에 OPENROUTER_API_KEY를 요구하므로 백엔드 모듈을 불러오기 전에 기본값을 넣습니다.
+"""
+import os
+
+os.environ.setdefault("OPENROUTER_API_KEY", "test-key")
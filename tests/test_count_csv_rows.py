@@ -0,0 +1,48 @@
+"""파싱 결과 CSV 행 수 계산 (count_csv_rows) 테스트"""
+import os
+
+from backend.api.system import count_csv_rows
+
+
+def _count(path) -> int:
+    stat = os.stat(path)
+    return count_csv_rows(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def test_counts_rows_excluding_header(tmp_path):
+    path = tmp_path / "doc_parsed.csv"
+    path.write_bytes(b"section_id,title\n1,a\n2,b\n3,c\n")
+    assert _count(path) == 3
+
+
+def test_counts_last_row_without_trailing_newline(tmp_path):
+    path = tmp_path / "doc_parsed.csv"
+    path.write_bytes(b"section_id,title\n1,a\n2,b")
+    assert _count(path) == 2
+
+
+def test_header_only_and_empty_files(tmp_path):
+    header_only = tmp_path / "header_parsed.csv"
+    header_only.write_bytes(b"section_id,title\n")
+    empty = tmp_path / "empty_parsed.csv"
+    empty.write_bytes(b"")
+    assert _count(header_only) == 0
+    assert _count(empty) == 0
+
+
+def test_recounts_when_file_changes(tmp_path):
+    path = tmp_path / "doc_parsed.csv"
+    path.write_bytes(b"section_id,title\n1,a\n")
+    assert _count(path) == 1
+    
+    path.write_bytes(b"section_id,title\n1,a\n2,b\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _count(path) == 2
+
+
+def test_counts_across_read_chunks(tmp_path):
+    path = tmp_path / "big_parsed.csv"
+    row = b"1," + b"x" * 1000 + b"\n"
+    path.write_bytes(b"section_id,title\n" + row * 3000)
+    assert _count(path) == 3000
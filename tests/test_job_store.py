@@ -0,0 +1,48 @@
+"""작업 저장소 (JobStore) 상태 카운터 테스트"""
+from backend.api.job_store import JobStore
+
+
+def test_counts_new_jobs_by_status():
+    store = JobStore()
+    store["a"] = {"status": "running"}
+    store["b"] = {"status": "running"}
+    store["c"] = {"status": "failed"}
+    
+    summary = store.summary()
+    assert summary["total"] == 3
+    assert summary["running"] == 2
+    assert summary["completed"] == 0
+    assert summary["failed"] == 1
+
+
+def test_reassigning_job_moves_its_count():
+    store = JobStore()
+    store["a"] = {"status": "running"}
+    store["a"] = {"status": "completed"}
+    
+    summary = store.summary()
+    assert len(store) == 1
+    assert summary["running"] == 0
+    assert summary["completed"] == 1
+
+
+def test_restarting_job_counts_it_once():
+    store = JobStore()
+    store["a"] = {"status": "running"}
+    store["a"] = {"status": "failed"}
+    store["a"] = {"status": "running"}
+    
+    summary = store.summary()
+    assert summary["running"] == 1
+    assert summary["failed"] == 0
+
+
+def test_mapping_access():
+    store = JobStore()
+    job = {"status": "running", "doc_id": "a"}
+    store["a"] = job
+    
+    assert "a" in store
+    assert "b" not in store
+    assert store["a"] is job
+    assert store.summary()["active_jobs"] == {"a": job}
@@ -0,0 +1,130 @@
+"""LLM 응답 캐시 백엔드 및 계층형 캐시 테스트"""
+import os
+
+import pytest
+from cachetools import TTLCache
+
+from backend.clients import llm_cache as llm_cache_module
+from backend.clients.llm_cache import (
+    DiskCacheBackend, LLMResponseCache, MemoryCacheBackend, SqliteCacheBackend, cache_key
+)
+
+
+@pytest.fixture(params=["memory", "disk", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend(maxsize=16, ttl=60)
+    if request.param == "disk":
+        return DiskCacheBackend(str(tmp_path / "llm_cache"), ttl=60)
+    return SqliteCacheBackend(str(tmp_path / "llm_cache.sqlite3"), ttl=60)
+
+
+class FailingBackend:
+    """항상 예외를 내는 백엔드"""
+    
+    def get(self, key):
+        raise OSError("unavailable")
+    
+    def set(self, key, value):
+        raise OSError("unavailable")
+    
+    def clear(self):
+        pass
+
+
+def test_backend_round_trip_and_clear(backend):
+    assert backend.get("ab12") is None
+    
+    backend.set("ab12", '{"toc_pages": [1]}')
+    backend.set("ab12", '{"toc_pages": [2]}')
+    assert backend.get("ab12") == '{"toc_pages": [2]}'
+    
+    backend.clear()
+    assert backend.get("ab12") is None
+
+
+def test_memory_entries_expire():
+    now = [0.0]
+    backend = MemoryCacheBackend(maxsize=16, ttl=60)
+    backend._cache = TTLCache(maxsize=16, ttl=60, timer=lambda: now[0])
+    backend.set("ab12", "value")
+    
+    now[0] = 59
+    assert backend.get("ab12") == "value"
+    now[0] = 61
+    assert backend.get("ab12") is None
+
+
+def test_disk_entries_expire(tmp_path):
+    backend = DiskCacheBackend(str(tmp_path), ttl=-1)
+    backend.set("ab12", "value")
+    assert backend.get("ab12") is None
+
+
+def test_disk_ignores_corrupt_files(tmp_path):
+    backend = DiskCacheBackend(str(tmp_path), ttl=60)
+    backend.set("ab12", "value")
+    with open(backend._path("ab12"), "wb") as f:
+        f.write(b"{not json")
+    assert backend.get("ab12") is None
+
+
+def test_disk_leaves_no_temporary_files(tmp_path):
+    backend = DiskCacheBackend(str(tmp_path), ttl=60)
+    backend.set("ab12", "value")
+    assert os.listdir(tmp_path / "ab") == ["ab12.json"]
+
+
+def test_sqlite_entries_expire_and_persist(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    SqliteCacheBackend(path, ttl=-1).set("expired", "value")
+    SqliteCacheBackend(path, ttl=60).set("fresh", "value")
+    
+    reopened = SqliteCacheBackend(path, ttl=60)
+    assert reopened.get("expired") is None
+    assert reopened.get("fresh") == "value"
+
+
+def test_lower_layer_hit_fills_upper_layers(tmp_path):
+    memory = MemoryCacheBackend(maxsize=16, ttl=60)
+    disk = DiskCacheBackend(str(tmp_path), ttl=60)
+    disk.set("ab12", "value")
+    cache = LLMResponseCache([memory, disk])
+    
+    assert cache.get("ab12") == "value"
+    assert memory.get("ab12") == "value"
+    assert cache.get("cd34") is None
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_failing_backend_is_skipped():
+    memory = MemoryCacheBackend(maxsize=16, ttl=60)
+    cache = LLMResponseCache([FailingBackend(), memory])
+    
+    cache.set("ab12", "value")
+    assert cache.get("ab12") == "value"
+
+
+async def test_async_access_with_blocking_backend(tmp_path):
+    cache = LLMResponseCache([
+        MemoryCacheBackend(maxsize=16, ttl=60),
+        SqliteCacheBackend(str(tmp_path / "llm_cache.sqlite3"), ttl=60),
+    ])
+    assert cache._blocking
+    
+    await cache.aset("ab12", "value")
+    assert await cache.aget("ab12") == "value"
+    assert not LLMResponseCache([MemoryCacheBackend(maxsize=16, ttl=60)])._blocking
+
+
+def test_cache_key_only_for_deterministic_calls(monkeypatch):
+    monkeypatch.setattr(llm_cache_module.settings, "LLM_CACHE_ENABLED", True)
+    messages = [{"role": "system", "content": "지시문"}, {"role": "user", "content": "페이지 1-5"}]
+    
+    assert cache_key(messages, None, 0.7) is None
+    assert cache_key(messages, None, 0.0) == cache_key(list(messages), None, 0.0)
+    assert cache_key(messages, None, 0.0, prompt_version="v1") != cache_key(messages, None, 0.0, prompt_version="v2")
+    assert cache_key(messages, None, 0.0) != cache_key(messages[1:], None, 0.0)
+    
+    monkeypatch.setattr(llm_cache_module.settings, "LLM_CACHE_ENABLED", False)
+    assert cache_key(messages, None, 0.0) is None
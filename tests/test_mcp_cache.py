@@ -0,0 +1,100 @@
+"""MCP 응답 TTL 캐시 (mcp_call_cached) 테스트"""
+import pytest
+from cachetools import TLRUCache
+
+from backend.clients import mcp_client
+from backend.clients.mcp_client import MCPClientError, mcp_call_cached
+from backend.config import settings
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """캐시 만료 시각을 조절할 수 있는 빈 MCP 캐시로 교체"""
+    now = [0.0]
+    cache = TLRUCache(maxsize=64, ttu=mcp_client._mcp_cache.ttu, timer=lambda: now[0])
+    monkeypatch.setattr(mcp_client, "_mcp_cache", cache)
+    return now
+
+
+@pytest.fixture
+def calls(monkeypatch, clock):
+    """mcp_call을 호출 기록만 남기는 가짜 함수로 교체"""
+    recorded = []
+    
+    async def fake_mcp_call(method, params):
+        recorded.append((method, params))
+        if params.get("fail"):
+            raise MCPClientError("MCP 예외")
+        return {"method": method, "call": len(recorded)}
+    
+    monkeypatch.setattr(mcp_client, "mcp_call", fake_mcp_call)
+    return recorded
+
+
+async def test_same_call_is_served_from_cache(calls):
+    first = await mcp_call_cached("pdf.read", {"doc_id": "a", "pages": [1], "mode": "plain"})
+    second = await mcp_call_cached("pdf.read", {"mode": "plain", "pages": [1], "doc_id": "a"})
+    
+    assert first is second
+    assert len(calls) == 1
+
+
+async def test_different_params_are_cached_separately(calls):
+    await mcp_call_cached("pdf.read", {"doc_id": "a", "pages": [1]})
+    await mcp_call_cached("pdf.read", {"doc_id": "a", "pages": [2]})
+    assert len(calls) == 2
+
+
+async def test_entry_expires_after_method_ttl(calls, clock):
+    params = {"doc_id": "a", "pages": [1]}
+    await mcp_call_cached("pdf.read", params)
+    
+    clock[0] = mcp_client.MCP_CACHE_TTLS["pdf.read"] - 1
+    await mcp_call_cached("pdf.read", params)
+    assert len(calls) == 1
+    
+    clock[0] = mcp_client.MCP_CACHE_TTLS["pdf.read"] + 1
+    await mcp_call_cached("pdf.read", params)
+    assert len(calls) == 2
+
+
+def test_get_info_ttl_follows_doc_info_setting():
+    assert mcp_client.MCP_CACHE_TTLS["pdf.get_info"] == settings.DOC_INFO_CACHE_TTL
+
+
+async def test_uncached_methods_and_zero_ttl_always_call(calls):
+    await mcp_call_cached("pdf.upload", {"doc_id": "a"})
+    await mcp_call_cached("pdf.upload", {"doc_id": "a"})
+    await mcp_call_cached("pdf.read", {"doc_id": "a"}, ttl=0)
+    await mcp_call_cached("pdf.read", {"doc_id": "a"}, ttl=0)
+    assert len(calls) == 4
+
+
+async def test_failures_are_not_cached(calls):
+    for _ in range(2):
+        with pytest.raises(MCPClientError):
+            await mcp_call_cached("pdf.read", {"doc_id": "a", "fail": True})
+    assert len(calls) == 2
+
+
+async def test_invalidate_evicts_only_that_document(calls):
+    await mcp_call_cached("pdf.get_info", {"doc_id": "a"})
+    await mcp_call_cached("pdf.read", {"doc_id": "a", "pages": [1]})
+    await mcp_call_cached("pdf.get_info", {"doc_id": "b"})
+    
+    mcp_client.invalidate_mcp_cache("a")
+    
+    await mcp_call_cached("pdf.get_info", {"doc_id": "a"})
+    await mcp_call_cached("pdf.read", {"doc_id": "a", "pages": [1]})
+    await mcp_call_cached("pdf.get_info", {"doc_id": "b"})
+    assert [params["doc_id"] for _, params in calls] == ["a", "a", "b", "a", "a"]
+
+
+async def test_read_pages_reuses_cached_single_page_reads(calls):
+    for page in (1, 2):
+        await mcp_call_cached("pdf.read", {"doc_id": "a", "pages": [page], "mode": "plain"})
+    
+    results = await mcp_client.pdf_read_pages("a", [2, 1, 2])
+    
+    assert sorted(results) == [1, 2]
+    assert len(calls) == 2
@@ -0,0 +1,80 @@
+"""MCP 호출 다중화기 (MCPMultiplexer) 테스트"""
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from backend.clients import mcp_client
+from backend.clients.mcp_client import MCPClientError, MCPMultiplexer
+
+
+class FakeBatchServer:
+    """JSON-RPC 배치 요청을 기록하고 id 역순으로 응답하는 가짜 MCP 서버"""
+    
+    def __init__(self, drop_ids=(), error_ids=()):
+        self.batches = []
+        self.drop_ids = set(drop_ids)
+        self.error_ids = set(error_ids)
+    
+    async def post(self, url, content, timeout):
+        requests = orjson.loads(content)
+        self.batches.append(requests)
+        responses = []
+        for request in reversed(requests):
+            if request["id"] in self.drop_ids:
+                continue
+            if request["id"] in self.error_ids:
+                responses.append({"jsonrpc": "2.0", "id": request["id"], "error": {"code": -1, "message": "bad"}})
+            else:
+                responses.append({"jsonrpc": "2.0", "id": request["id"], "result": request["params"]})
+        return httpx.Response(200, content=orjson.dumps(responses), request=httpx.Request("POST", url))
+
+
+@pytest.fixture
+def server(monkeypatch):
+    fake = FakeBatchServer()
+    monkeypatch.setattr(mcp_client, "_get_async_client", lambda: fake)
+    return fake
+
+
+async def test_concurrent_calls_share_one_batch(server):
+    multiplexer = MCPMultiplexer()
+    try:
+        results = await asyncio.gather(
+            *(multiplexer.call("pdf.read", {"pages": [page]}, timeout=5) for page in range(5))
+        )
+    finally:
+        await multiplexer.aclose()
+    
+    assert results == [{"pages": [page]} for page in range(5)]
+    assert len(server.batches) == 1
+    assert len(server.batches[0]) == 5
+
+
+async def test_batches_are_capped_at_max_batch_size(server):
+    multiplexer = MCPMultiplexer(max_batch_size=2)
+    try:
+        await asyncio.gather(*(multiplexer.call("pdf.read", {"page": page}, timeout=5) for page in range(5)))
+    finally:
+        await multiplexer.aclose()
+    
+    assert [len(batch) for batch in server.batches] == [2, 2, 1]
+
+
+async def test_error_and_missing_responses_fail_only_their_calls(server):
+    server.error_ids.add(1)
+    server.drop_ids.add(2)
+    multiplexer = MCPMultiplexer()
+    try:
+        results = await asyncio.gather(
+            *(multiplexer.call("pdf.read", {"page": page}, timeout=5) for page in range(3)),
+            return_exceptions=True
+        )
+    finally:
+        await multiplexer.aclose()
+    
+    assert isinstance(results[0], MCPClientError) and "bad" in str(results[0])
+    assert isinstance(results[1], MCPClientError) and "누락" in str(results[1])
+    assert results[2] == {"page": 2}
+    assert not multiplexer.pending
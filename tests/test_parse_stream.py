@@ -0,0 +1,137 @@
+"""파싱 진행 상황 SSE (시작/구독/재전송) 테스트"""
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI
+
+from backend.api import parsing
+from backend.api.job_store import JobStore
+from backend.api.parsing import _ParseProgress
+from backend.models.state import JobStatus
+
+
+def _events(body: bytes):
+    """SSE 본문을 (이벤트 이름, 데이터) 목록으로 분리"""
+    events = []
+    for block in body.decode().strip().split("\n\n"):
+        name, data = "message", None
+        for line in block.splitlines():
+            if line.startswith("event: "):
+                name = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = orjson.loads(line[len("data: "):])
+        events.append((name, data))
+    return events
+
+
+@pytest.fixture
+def flow(monkeypatch):
+    """노드 두 개를 실행하는 가짜 파싱 플로우 (release가 set될 때까지 두 번째 노드 대기)"""
+    release = asyncio.Event()
+    
+    async def fake_flow(doc_id, window_size):
+        state = {"doc_id": doc_id, "job_status": JobStatus.RUNNING, "logs": ["문서 정보 조회 완료"]}
+        yield {"doc_info": dict(state)}
+        await release.wait()
+        state.update(job_status=JobStatus.COMPLETED, csv_path="outputs/a_parsed.csv")
+        state["logs"] = state["logs"] + ["CSV 저장 완료"]
+        yield {"write_csv": dict(state)}
+    
+    monkeypatch.setattr(parsing, "run_parsing_flow_with_stream", fake_flow)
+    monkeypatch.setattr(parsing, "active_jobs", JobStore())
+    monkeypatch.setattr(parsing, "_progress", {})
+    return release
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(parsing.router)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_late_subscriber_replays_from_start():
+    progress = _ParseProgress()
+    progress.publish(b"a")
+    progress.publish(b"b")
+    
+    received = []
+    
+    async def subscribe():
+        async for event in progress.subscribe():
+            received.append(event)
+    
+    task = asyncio.create_task(subscribe())
+    await asyncio.sleep(0)
+    assert received == [b"a", b"b"]
+    
+    progress.publish(b"end", done=True)
+    await task
+    assert received == [b"a", b"b", b"end"]
+
+
+async def test_finished_progress_compacts_after_subscribers_drain():
+    progress = _ParseProgress()
+    progress.publish(b"a")
+    
+    subscription = progress.subscribe()
+    assert await subscription.__anext__() == b"a"
+    progress.publish(b"end", done=True)
+    progress.compact()
+    assert progress.events == [b"a", b"end"]
+    
+    assert [event async for event in subscription] == [b"end"]
+    assert progress.subscribers == 0
+    assert progress.events == [b"end"]
+    assert [event async for event in progress.subscribe()] == [b"end"]
+
+
+async def test_post_starts_job_and_get_streams_progress(client, flow):
+    response = await client.post("/parse/stream/a")
+    assert response.status_code == 202
+    assert response.json()["stream_url"].endswith("/parse/stream/a")
+    
+    # 구독이 시작된 뒤 플로우를 진행시켜 중간 이벤트가 압축되기 전에 받도록 함
+    stream = asyncio.create_task(client.get("/parse/stream/a"))
+    while not parsing._progress["a"].subscribers:
+        await asyncio.sleep(0)
+    flow.set()
+    response = await stream
+    assert response.headers["content-type"].startswith("text/event-stream")
+    
+    events = _events(response.content)
+    assert [(name, data.get("node")) for name, data in events] == [
+        ("message", "doc_info"), ("message", "write_csv"), ("end", None)
+    ]
+    assert events[0][1]["logs"] == ["문서 정보 조회 완료"]
+    assert events[1][1]["logs"] == ["CSV 저장 완료"]
+    assert events[2][1]["status"] == "completed"
+    assert parsing.active_jobs["a"]["csv_path"] == "outputs/a_parsed.csv"
+
+
+async def test_get_after_completion_returns_final_result(client, flow):
+    flow.set()
+    assert (await client.post("/parse/stream/a")).status_code == 202
+    await asyncio.gather(*parsing._parse_tasks)
+    
+    events = _events((await client.get("/parse/stream/a")).content)
+    assert [name for name, _ in events] == ["end"]
+    assert events[0][1]["status"] == "completed"
+
+
+async def test_post_while_running_conflicts(client, flow):
+    assert (await client.post("/parse/stream/a")).status_code == 202
+    assert (await client.post("/parse/stream/a")).status_code == 409
+    
+    flow.set()
+    await asyncio.gather(*parsing._parse_tasks)
+    assert (await client.post("/parse/stream/a")).status_code == 202
+    flow.set()
+    await asyncio.gather(*parsing._parse_tasks)
+
+
+async def test_get_unknown_job_is_not_found(client, flow):
+    assert (await client.get("/parse/stream/missing")).status_code == 404
@@ -0,0 +1,155 @@
+"""여러 윈도우 배치 목차 탐지 (응답 JSON 매칭, 캐시, 노드 병합) 테스트"""
+import orjson
+import pytest
+
+from backend.clients.llm_cache import LLMResponseCache, MemoryCacheBackend
+from backend.clients.semantic_cache import SemanticCache
+from backend.langgraph import nodes
+from backend.models.state import JobStatus, create_initial_state
+
+
+class FakeLLM:
+    """미리 정한 응답을 순서대로 돌려주고 받은 프롬프트를 기록하는 가짜 LLM"""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.prompts = []
+    
+    async def __call__(self, prompt, temperature=0.0, **kwargs):
+        self.prompts.append(prompt)
+        response = self.responses.pop(0)
+        return response(prompt) if callable(response) else response
+
+
+def _batch_response(*items):
+    return orjson.dumps({"results": list(items)}).decode()
+
+
+def _windows_in(prompt):
+    """배치 프롬프트 사용자 메시지에 나열된 윈도우 수"""
+    return prompt[-1]["content"].count("## 윈도우 ")
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    """전역 LLM/유사도 캐시 대신 테스트마다 빈 메모리 캐시 사용"""
+    monkeypatch.setattr(nodes, "llm_cache", LLMResponseCache([MemoryCacheBackend(maxsize=64, ttl=60)]))
+    monkeypatch.setattr(nodes, "semantic_cache", SemanticCache(threshold=0.95))
+    monkeypatch.setattr(nodes.settings, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(nodes.settings, "SEMANTIC_CACHE_ENABLED", False)
+    monkeypatch.setattr(nodes.settings, "TOC_CASCADE_ENABLED", False)
+
+
+def _use_llm(monkeypatch, *responses):
+    llm = FakeLLM(*responses)
+    monkeypatch.setattr(nodes, "openrouter_chat_async", llm)
+    return llm
+
+
+async def test_results_are_matched_by_window_id(monkeypatch):
+    _use_llm(monkeypatch, _batch_response(
+        {"window_id": 1, "toc_pages": [6], "confidence": 0.8, "reason": "b"},
+        {"window_id": 0, "toc_pages": [1, 2], "confidence": 0.9, "reason": "a"},
+    ))
+    
+    results = await nodes._detect_window_batch("a", [[0, 1, 2], [5, 6, 7]])
+    
+    assert [result["toc_pages"] for result in results] == [[1, 2], [6]]
+
+
+async def test_missing_and_malformed_items_count_as_no_toc(monkeypatch):
+    _use_llm(monkeypatch, _batch_response("not a dict", {"window_id": 0, "toc_pages": [1], "confidence": 0.9}))
+    
+    results = await nodes._detect_window_batch("a", [[0, 1], [2, 3]])
+    
+    assert results[0]["toc_pages"] == [1]
+    assert results[1] == {"toc_pages": [], "confidence": 0.0, "reason": ""}
+
+
+async def test_null_results_field(monkeypatch):
+    _use_llm(monkeypatch, '{"results": null}')
+    results = await nodes._detect_window_batch("a", [[0], [1]])
+    assert [result["toc_pages"] for result in results] == [[], []]
+
+
+async def test_invalid_json_raises_and_is_not_cached(monkeypatch):
+    llm = _use_llm(monkeypatch, "목차는 1페이지입니다", _batch_response({"window_id": 0, "toc_pages": [1]}))
+    
+    with pytest.raises(orjson.JSONDecodeError):
+        await nodes._detect_window_batch("a", [[0], [1]])
+    
+    results = await nodes._detect_window_batch("a", [[0], [1]])
+    assert results[0]["toc_pages"] == [1]
+    assert len(llm.prompts) == 2
+
+
+async def test_valid_response_is_cached(monkeypatch):
+    llm = _use_llm(monkeypatch, _batch_response({"window_id": 0, "toc_pages": [1]}))
+    
+    first = await nodes._detect_window_batch("a", [[0], [1]])
+    second = await nodes._detect_window_batch("a", [[0], [1]])
+    
+    assert first == second
+    assert len(llm.prompts) == 1
+
+
+def _toc_pages_in(toc_pages):
+    """프롬프트에 나열된 윈도우별로 toc_pages 중 그 윈도우에 속한 페이지를 돌려주는 응답 생성기"""
+    def respond(prompt):
+        window_lines = [line for line in prompt[-1]["content"].splitlines() if line.startswith("## 윈도우 ")]
+        if not window_lines:
+            # 윈도우가 하나인 묶음은 단일 윈도우 프롬프트로 호출됨
+            return '{"toc_pages": [], "confidence": 0.9, "reason": ""}'
+        
+        items = []
+        for window_id, line in enumerate(window_lines):
+            pages = orjson.loads(line.split("페이지 ", 1)[1].split(" (", 1)[0])
+            items.append({"window_id": window_id, "toc_pages": [p for p in pages if p in toc_pages], "confidence": 0.9})
+        return _batch_response(*items)
+    return respond
+
+
+async def test_node_batches_windows_and_merges_in_order(monkeypatch):
+    monkeypatch.setattr(nodes.settings, "TOC_DETECT_BATCH_WINDOWS", 2)
+    llm = _use_llm(monkeypatch, *[_toc_pages_in({2, 11})] * 3)
+    state = create_initial_state("a", window_size=5)
+    state["total_pages"] = 23
+    
+    state = await nodes.node_detect_toc_all(state)
+    
+    assert state.get("error") is None
+    assert state["toc_pages"] == [2, 11]
+    assert state["window_start"] == 23
+    # 5개 윈도우 → 2개씩 묶은 배치 2회 + 남은 윈도우 하나는 단일 윈도우 프롬프트
+    assert sorted(_windows_in(prompt) for prompt in llm.prompts) == [0, 2, 2]
+
+
+async def test_node_fails_on_unparseable_batch(monkeypatch):
+    monkeypatch.setattr(nodes.settings, "TOC_DETECT_BATCH_WINDOWS", 4)
+    _use_llm(monkeypatch, "{")
+    state = create_initial_state("a", window_size=5)
+    state["total_pages"] = 20
+    
+    state = await nodes.node_detect_toc_all(state)
+    
+    assert state["job_status"] == JobStatus.FAILED
+    assert "파싱 실패" in state["error"]
+
+
+async def test_semantic_hits_skip_batching(monkeypatch):
+    monkeypatch.setattr(nodes.settings, "SEMANTIC_CACHE_ENABLED", True)
+    monkeypatch.setattr(nodes.settings, "TOC_DETECT_BATCH_WINDOWS", 4)
+    
+    async def fake_pdf_read(doc_id, pages, mode="plain"):
+        return {"plain": f"보험약관 공통 조항 본문 {pages[0] // 5} " * 20}
+    
+    monkeypatch.setattr(nodes, "pdf_read", fake_pdf_read)
+    llm = _use_llm(monkeypatch, _toc_pages_in({1}))
+    
+    for doc_id in ("a", "b"):
+        state = create_initial_state(doc_id, window_size=5)
+        state["total_pages"] = 20
+        state = await nodes.node_detect_toc_all(state)
+        assert state["toc_pages"] == [1]
+    
+    assert len(llm.prompts) == 1
@@ -0,0 +1,44 @@
+"""규칙 기반 목차 판별 (cheap_toc_score) 테스트"""
+from backend.config import settings
+from backend.langgraph.nodes import cheap_toc_score
+
+TOC_PAGE = """목 차
+제1관 목적 및 용어의 정의 .......... 3
+제2관 보험금의 지급 .......... 5
+제3관 계약자의 계약 전 알릴 의무 등 .......... 9
+제4관 보험계약의 성립과 유지 .......... 12
+제5관 보험료의 납입 .......... 15
+제6관 계약의 해지 및 해지환급금 등 .......... 18
+"""
+
+BODY_PAGE = """제1조(목적)
+이 보험계약은 보험계약자와 보험회사 사이에 피보험자의 질병에 대한 위험을 보장하기 위하여
+체결됩니다. 회사는 피보험자가 보험기간 중 진단 확정된 경우 보험금을 지급합니다.
+다만, 계약일부터 그 날을 포함하여 90일이 지난 날의 다음날부터 보장합니다.
+"""
+
+
+def test_toc_page_scores_above_high_threshold():
+    assert cheap_toc_score(TOC_PAGE) >= settings.TOC_CASCADE_HIGH
+
+
+def test_body_page_scores_below_low_threshold():
+    assert cheap_toc_score(BODY_PAGE) < settings.TOC_CASCADE_LOW
+
+
+def test_empty_page_scores_zero():
+    assert cheap_toc_score("") == 0.0
+    assert cheap_toc_score("  \n\n ") == 0.0
+
+
+def test_numbered_leaders_without_title_still_score_high():
+    page = "\n".join(f"제{i}조 보장 내용 ·········· {i * 2}" for i in range(1, 11))
+    assert cheap_toc_score(page) >= settings.TOC_CASCADE_HIGH
+
+
+def test_score_is_capped_at_one():
+    assert cheap_toc_score(TOC_PAGE * 3) <= 1.0
+
+
+def test_cascade_disabled_by_default():
+    assert type(settings).model_fields["TOC_CASCADE_ENABLED"].default is False